@@ -7,7 +7,10 @@ and application behavior.
 """
 
 import os
+import sys
 from pathlib import Path
+from types import MappingProxyType
+from typing import Any, Dict, Optional
 
 # Application Information
 APP_NAME = "Logistics Document Generator"
@@ -31,9 +34,9 @@ SECURITY = {
     'MAX_FILENAME_LENGTH': 255,
     
     # Allowed file extensions
-    'ALLOWED_EXCEL_EXTENSIONS': {'.xlsx', '.xls'},
-    'ALLOWED_TEMPLATE_EXTENSIONS': {'.docx'},
-    'ALLOWED_OUTPUT_EXTENSIONS': {'.docx'},
+    'ALLOWED_EXCEL_EXTENSIONS': frozenset(map(sys.intern, ('.xlsx', '.xls'))),
+    'ALLOWED_TEMPLATE_EXTENSIONS': frozenset(map(sys.intern, ('.docx',))),
+    'ALLOWED_OUTPUT_EXTENSIONS': frozenset(map(sys.intern, ('.docx',))),
     
     # Directory security
     'RESTRICT_TO_WORKSPACE': True,
@@ -91,6 +94,8 @@ GUI = {
 # Validation Rules
 VALIDATION = {
     'SHIPMENT_NUMBER_LENGTH': 10,
+    'SHIPMENT_NUMBER_MIN_LENGTH': 8,
+    'SHIPMENT_NUMBER_MAX_LENGTH': 12,
     'DO_NUMBER_MIN_LENGTH': 8,
     'DO_NUMBER_MAX_LENGTH': 15,
     'MIN_QUANTITY': 0,
@@ -136,24 +141,80 @@ def get_log_path() -> Path:
 
 def ensure_directories():
     """Ensure all required directories exist"""
-    for dir_name in DIRECTORIES.values():
-        dir_path = get_workspace_path() / dir_name
-        dir_path.mkdir(exist_ok=True, mode=0o755)
+    workspace = get_workspace_path()
+    
+    # One directory listing answers "already exists?" for every folder,
+    # so warm runs don't issue a mkdir per configured directory
+    with os.scandir(workspace) as entries:
+        existing = {entry.name for entry in entries if entry.is_dir()}
+    
+    for dir_name in set(DIRECTORIES.values()) - existing:
+        (workspace / dir_name).mkdir(exist_ok=True, mode=0o755)
 
 # Environment-specific overrides
-def load_environment_config():
-    """Load environment-specific configuration overrides"""
-    env = os.getenv('LOGISTICS_ENV', 'production').lower()
+_ENVIRONMENT_OVERRIDES: Dict[str, Dict[str, Dict[str, Any]]] = {
+    'development': {
+        'LOGGING': {'LEVEL': 'DEBUG'},
+        'SECURITY': {'MAX_RECORDS_PER_BATCH': 1000},  # Smaller for testing
+        'PERFORMANCE': {'MAX_MEMORY_USAGE_MB': 256},
+    },
+    'testing': {
+        'LOGGING': {'LEVEL': 'WARNING'},
+        'SECURITY': {'MAX_RECORDS_PER_BATCH': 100},
+        'PERFORMANCE': {'MAX_MEMORY_USAGE_MB': 128},
+        'GUI': {'ENABLE_CONSOLE': False},
+    },
+}
+
+# Pristine defaults; the public names below are read-only views over the
+# effective values (defaults plus environment overrides), so callers can't
+# mutate shared configuration and reloads stay visible to existing imports.
+_BASE_CONFIG = {
+    'SECURITY': dict(SECURITY),
+    'PERFORMANCE': dict(PERFORMANCE),
+    'LOGGING': dict(LOGGING),
+    'GUI': dict(GUI),
+}
+_EFFECTIVE_CONFIG: Dict[str, Dict[str, Any]] = {section: {} for section in _BASE_CONFIG}
+
+SECURITY = MappingProxyType(_EFFECTIVE_CONFIG['SECURITY'])
+PERFORMANCE = MappingProxyType(_EFFECTIVE_CONFIG['PERFORMANCE'])
+LOGGING = MappingProxyType(_EFFECTIVE_CONFIG['LOGGING'])
+GUI = MappingProxyType(_EFFECTIVE_CONFIG['GUI'])
+
+_loaded_environment: Optional[str] = None
+
+def reload_config(env: Optional[str] = None) -> str:
+    """
+    Rebuild the effective configuration for an environment
+    
+    Args:
+        env: Environment name (reads LOGISTICS_ENV if None)
+        
+    Returns:
+        The environment that was applied
+    """
+    global _loaded_environment
     
-    if env == 'development':
-        LOGGING['LEVEL'] = 'DEBUG'
-        SECURITY['MAX_RECORDS_PER_BATCH'] = 1000  # Smaller for testing
-        PERFORMANCE['MAX_MEMORY_USAGE_MB'] = 256
-    elif env == 'testing':
-        LOGGING['LEVEL'] = 'WARNING'
-        SECURITY['MAX_RECORDS_PER_BATCH'] = 100
-        PERFORMANCE['MAX_MEMORY_USAGE_MB'] = 128
-        GUI['ENABLE_CONSOLE'] = False
+    if env is None:
+        env = os.getenv('LOGISTICS_ENV', 'production')
+    env = env.lower()
+    
+    overrides = _ENVIRONMENT_OVERRIDES.get(env, {})
+    for section, defaults in _BASE_CONFIG.items():
+        effective = _EFFECTIVE_CONFIG[section]
+        effective.clear()
+        effective.update(defaults)
+        effective.update(overrides.get(section, {}))
+    
+    _loaded_environment = env
+    return env
+
+def load_environment_config() -> str:
+    """Load environment-specific configuration overrides once per process"""
+    if _loaded_environment is None:
+        return reload_config()
+    return _loaded_environment
 
 # Load environment config on import
-load_environment_config() 
\ No newline at end of file
+load_environment_config()
@@ -14,15 +14,9 @@ Features:
 - GUI and CLI interfaces
 """
 
-from .core import PlacardGenerator
-from .security import (
-    InputValidator, 
-    PathSanitizer, 
-    SecureFileHandler, 
-    SecurityConfig,
-    SecurityError,
-    RateLimiter
-)
+import importlib
+from typing import Any
+
 from .config import (
     APP_NAME,
     APP_VERSION,
@@ -66,13 +60,30 @@ __all__ = [
     "__license__",
 ]
 
-# Initialize logging when package is imported
-import logging
-from .utils import setup_logging
+# Heavy submodules (pandas, python-docx, openpyxl) are only imported on first
+# attribute access so that `--version`, `--info` and friends start quickly.
+# Logging is configured by the CLI or by PlacardGenerator, not at import time.
+_LAZY_ATTRIBUTES = {
+    "PlacardGenerator": ".core",
+    "InputValidator": ".security",
+    "PathSanitizer": ".security",
+    "SecureFileHandler": ".security",
+    "SecurityConfig": ".security",
+    "SecurityError": ".security",
+    "RateLimiter": ".security",
+}
+
+
+def __getattr__(name: str) -> Any:
+    """Lazily import heavy package attributes (PEP 562)"""
+    module_name = _LAZY_ATTRIBUTES.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
 
-# Setup default logging configuration
-setup_logging()
 
-# Package-level logger
-logger = logging.getLogger(__name__)
-logger.info(f"Initialized {APP_NAME} v{__version__}") 
\ No newline at end of file
+def __dir__() -> list:
+    return sorted(set(globals()) | set(__all__))
@@ -12,17 +12,60 @@ import logging
 from pathlib import Path
 from typing import List, Optional
 
-from .core import PlacardGenerator
 from .utils import (
     setup_logging, 
     validate_package_installation,
     get_version_info,
     ensure_package_directories
 )
+from .config import VALIDATION
 from . import __version__, __author__
 
 
-def create_parser() -> argparse.ArgumentParser:
+def _shipment_id(value: str) -> str:
+    """argparse type: a stripped shipment number within the configured lengths"""
+    shipment = value.strip()
+    min_length = VALIDATION['SHIPMENT_NUMBER_MIN_LENGTH']
+    max_length = VALIDATION['SHIPMENT_NUMBER_MAX_LENGTH']
+    if not (min_length <= len(shipment) <= max_length) or not shipment.isdigit():
+        raise argparse.ArgumentTypeError(
+            f"invalid shipment number '{value}' (must be {min_length}-{max_length} digits)"
+        )
+    return shipment
+
+
+def _existing_file(value: str) -> str:
+    """argparse type: path to an existing file"""
+    if not Path(value).is_file():
+        raise argparse.ArgumentTypeError(f"file not found: '{value}'")
+    return value
+
+
+_PARSER: Optional[argparse.ArgumentParser] = None
+
+
+def create_parser(fresh: bool = False) -> argparse.ArgumentParser:
+    """
+    Return the configured argument parser
+    
+    The parser is built once and reused across main() calls. Treat the
+    returned instance as read-only; pass fresh=True to get a new parser
+    that can safely be modified.
+    
+    Args:
+        fresh: Build and return a new, uncached parser
+    """
+    global _PARSER
+    
+    if fresh:
+        return _build_parser()
+    
+    if _PARSER is None:
+        _PARSER = _build_parser()
+    return _PARSER
+
+
+def _build_parser() -> argparse.ArgumentParser:
     """Create and configure the argument parser"""
     parser = argparse.ArgumentParser(
         prog='placard-generator',
@@ -55,6 +98,7 @@ def create_parser() -> argparse.ArgumentParser:
     parser.add_argument(
         '-s', '--shipments',
         nargs='+',
+        type=_shipment_id,
         help='Specific shipment numbers to process (space-separated)'
     )
     
@@ -66,13 +110,13 @@ def create_parser() -> argparse.ArgumentParser:
     
     parser.add_argument(
         '-f', '--file',
-        type=str,
+        type=_existing_file,
         help='Specify Excel file path (overrides auto-detection)'
     )
     
     parser.add_argument(
         '-t', '--template',
-        type=str,
+        type=_existing_file,
         help='Specify template file path (overrides default)'
     )
     
@@ -202,8 +246,13 @@ def setup_directories() -> None:
 
 def run_generator(args: argparse.Namespace) -> int:
     """Run the placard generator with the given arguments"""
+    # Imported here so that information commands never load pandas/python-docx
+    from .core import PlacardGenerator
+    
+    generator = None
     try:
         generator = PlacardGenerator()
+        generator.verbose = not args.quiet
         
         # Initialize directories and logging
         if not generator.setup_directories():
@@ -231,15 +280,8 @@ def run_generator(args: argparse.Namespace) -> int:
             return 0 if failed == 0 else 1
             
         elif args.shipments:
-            # Process specific shipments
-            successful = 0
-            failed = 0
-            
-            for shipment in args.shipments:
-                if generator.process_shipment(shipment.strip()):
-                    successful += 1
-                else:
-                    failed += 1
+            # Process specific shipments in a single pass over the dataset
+            successful, failed = generator.process_shipments_bulk(args.shipments)
             
             print(f"\nProcessing complete:")
             print(f"  Successful: {successful}")
@@ -260,6 +302,9 @@ def run_generator(args: argparse.Namespace) -> int:
         print(f"ERROR: {e}")
         logging.exception("Unexpected error in CLI")
         return 1
+    finally:
+        if generator is not None:
+            generator.close_log()
 
 
 def main(argv: Optional[List[str]] = None) -> int:
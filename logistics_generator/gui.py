@@ -11,6 +11,7 @@ Version: 2.0.0
 """
 
 import os
+import queue
 import sys
 import threading
 import time
@@ -18,16 +19,18 @@ import traceback
 import logging
 import weakref
 from datetime import datetime
-from typing import List, Dict, Optional, Tuple, Any, Set, cast
+from typing import List, Dict, Optional, Tuple, Any, Set, NamedTuple, Callable, cast
 from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
 import gc
 
 import dearpygui.dearpygui as dpg
+import numpy as np
 import pandas as pd
 
 # Import the existing placard generator functionality
 try:
-    from placard_generator import PlacardGenerator
+    from placard_generator import PlacardGenerator, configure_logging
     from security_utils import (
         InputValidator, PathSanitizer, SecurityError, 
         RateLimiter, SecurityConfig, security_logger
@@ -37,11 +40,73 @@ except ImportError as e:
     print("Please ensure placard_generator.py and security_utils.py are in the same directory.")
     sys.exit(1)
 
+# psutil is optional and only feeds the memory monitoring in _cleanup_memory;
+# the process handle is created once and reused by every cleanup.
+try:
+    import psutil
+    _PROCESS: Optional["psutil.Process"] = psutil.Process()
+except ImportError:
+    _PROCESS = None
+
+# System fonts as (regular, bold) per sys.platform. The running platform's
+# fonts are tried first, so the usual case costs a single existence check;
+# the others stay as fallbacks.
+_SYSTEM_FONTS = {
+    'win32': ("C:/Windows/Fonts/segoeui.ttf", "C:/Windows/Fonts/segoeuib.ttf"),
+    'darwin': ("/System/Library/Fonts/Arial.ttf", "/System/Library/Fonts/Arial Bold.ttf"),
+    'linux': ("/usr/share/fonts/truetype/dejavu/DejaVuSans.ttf",
+              "/usr/share/fonts/truetype/dejavu/DejaVuSans-Bold.ttf"),
+}
+_FONT_CANDIDATES = sorted(_SYSTEM_FONTS.values(), key=lambda fonts: fonts != _SYSTEM_FONTS.get(sys.platform))
+
+# Installed as logistics_generator.gui, use the package's logging setup
+try:
+    from .utils import setup_logging
+except ImportError:
+    setup_logging = None
+
 # Configure GUI-specific logging
 gui_logger = logging.getLogger('gui_app')
 gui_logger.setLevel(logging.INFO)
 
 
+class _FilterColumn(NamedTuple):
+    """A filter column's values as integer codes into its distinct values
+    
+    For comma-separated columns (DO numbers, POs) there is one code per part
+    and rows holds the table row each part belongs to; otherwise rows is
+    None and there is one code per table row. categories is a hashed index,
+    so the selected values can be looked up in it directly.
+    """
+    codes: np.ndarray
+    categories: pd.Index
+    rows: Optional[np.ndarray]
+
+
+class _TableRow(NamedTuple):
+    """Item ids of a reusable shipment table row (see refresh_table)"""
+    row: int
+    checkbox: int
+    texts: List[int]
+
+
+# Shipment table text columns after the checkbox, as (field, display limit,
+# text color); longer values are cut to the limit and end in "..."
+_TABLE_TEXT_COLUMNS: List[Tuple[str, Optional[int], List[int]]] = [
+    ('shipment_nbr', None, [240, 240, 240]),
+    ('do_numbers', 50, [240, 240, 240]),
+    ('do_count', None, [240, 240, 240]),
+    ('ship_to', 25, [240, 240, 240]),
+    ('po', 25, [240, 240, 240]),
+    ('vas', 15, [240, 240, 240]),
+    ('original_qty', None, [34, 139, 34]),
+    ('label_type', 15, [240, 240, 240]),
+    ('order_type', 15, [240, 240, 240]),
+    ('pmt_term', 15, [240, 240, 240]),
+    ('start_ship', 15, [240, 240, 240]),
+]
+
+
 class PlacardGeneratorGUI:
     """Professional GUI interface for the Logistics Document Generator with comprehensive error handling"""
     
@@ -52,21 +117,40 @@ class PlacardGeneratorGUI:
             self.generator = PlacardGenerator()
             self.shipment_data: List[Dict[str, Any]] = []
             self.filtered_data: List[Dict[str, Any]] = []
+            # Columnar copy of shipment_data (same row order) for vectorized
+            # filtering and validation, plus each filter column's values and
+            # the search text as the filters compare them, prepared once per
+            # load (see _set_shipment_data)
+            self.shipment_df = pd.DataFrame()
+            self._filter_values: Dict[str, _FilterColumn] = {}
+            self._search_haystack = pd.Series(dtype=str)
+            # Position of each shipment in shipment_data, by shipment number
+            self._shipment_positions: Dict[str, int] = {}
+            # Shipment table rows created so far and how many of them are shown
+            self._table_rows: List[_TableRow] = []
+            self._table_rows_shown = 0
             self.selected_shipments: Set[str] = set()
             self.is_processing = False
             self.data_loaded = False
             self.load_error = ""
             self.search_text = ""
+            # Pending re-filter for the latest search keystroke (see search_callback)
+            self._search_timer: Optional[threading.Timer] = None
+            self._search_debounce_seconds = 0.15
             
             # Thread safety and security
             self._processing_lock = threading.RLock()
             self._shutdown_event = threading.Event()
+            # Excel parsing and row building run on this worker; anything that
+            # touches Dear PyGui is queued back and run by the render loop
+            self._load_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="data-load")
+            self._ui_tasks: "queue.Queue[Callable[[], None]]" = queue.Queue()
             self.rate_limiter = RateLimiter(SecurityConfig.MAX_OPERATIONS_PER_MINUTE)
             
             # Memory management
             self._memory_cleanup_interval = 30  # seconds
             self._last_cleanup = time.time()
-            self._weak_references: Set[weakref.ref] = set()
+            self._weak_references: "weakref.WeakSet[Any]" = weakref.WeakSet()  # drops dead entries itself
             
             # Column filters with size limits
             self.column_filters = {
@@ -132,10 +216,28 @@ class PlacardGeneratorGUI:
                 'background': [40, 44, 52],    # Solid dark blue-gray background
                 'surface': [50, 54, 62],       # Solid surface color
             }
+            # Status bar text color per status type; anything else shows white
+            self._status_colors = {
+                'success': self.colors['success'],
+                'warning': self.colors['warning'],
+                'error': self.colors['danger'],
+            }
             
             # Console log with memory management - use deque for O(1) operations
-            self.console_logs = deque(maxlen=50)  # Limit to 50 messages to prevent memory leaks
+            # Holds the formatted "[HH:MM:SS] message" lines, the only part the console shows
+            self.console_logs: "deque[str]" = deque(maxlen=50)  # Limit to 50 messages to prevent memory leaks
             self.max_console_lines = 50  # Reduced from 100 for better memory management
+            self._clock_cache: Tuple[int, str] = (-1, "")  # (second, "HH:MM:SS"), see _clock_time
+            # Set when console_logs changes; the render loop redraws the
+            # console at most once per frame (see _render_loop)
+            self._console_dirty = False
+            
+            # Item ids of the status and console widgets, set by
+            # create_main_window and cleared on teardown, so the logging paths
+            # need no does_item_exist lookup per call
+            self._status_text_id: Optional[int] = None
+            self._console_text_id: Optional[int] = None
+            self._console_window_id: Optional[int] = None
             
             # Performance monitoring
             self._operation_times = deque(maxlen=100)
@@ -174,7 +276,7 @@ class PlacardGeneratorGUI:
         try:
             return operation_func(*args, **kwargs)
         except Exception as e:
-            self.log_to_console(f"GUI operation '{operation_name}' failed: {str(e)}", "error")
+            self.log_to_console(f"GUI operation '{operation_name}' failed: {str(e)}", "error", trusted=False)
             return None
     
     def _validate_data_integrity(self) -> bool:
@@ -184,28 +286,26 @@ class PlacardGeneratorGUI:
                 self.update_status("No data loaded for validation", "warning")
                 return False
             
-            # Check for required fields in each shipment record
+            # Check for required fields in each shipment record, on the columnar copy
             required_fields = ['shipment_nbr', 'do_numbers', 'ship_to', 'original_qty']
-            invalid_records = []
-            
-            for i, shipment in enumerate(self.shipment_data):
-                missing_fields = [field for field in required_fields if not shipment.get(field)]
-                if missing_fields:
-                    invalid_records.append(f"Record {i+1}: missing {', '.join(missing_fields)}")
-            
-            if invalid_records:
-                self.log_to_console(f"Data validation failed: {len(invalid_records)} invalid records", "error")
-                for record in invalid_records[:5]:  # Show first 5 errors
-                    self.log_to_console(f"  - {record}", "error")
-                if len(invalid_records) > 5:
-                    self.log_to_console(f"  ... and {len(invalid_records) - 5} more errors", "error")
+            required = self.shipment_df[required_fields]
+            missing = (required.isna() | required.eq('')).to_numpy()
+            invalid_rows = np.flatnonzero(missing.any(axis=1))
+            
+            if len(invalid_rows):
+                self.log_to_console(f"Data validation failed: {len(invalid_rows)} invalid records", "error")
+                for i in invalid_rows[:5]:  # Show first 5 errors
+                    missing_fields = [field for field, gap in zip(required_fields, missing[i]) if gap]
+                    self.log_to_console(f"  - Record {i+1}: missing {', '.join(missing_fields)}", "error")
+                if len(invalid_rows) > 5:
+                    self.log_to_console(f"  ... and {len(invalid_rows) - 5} more errors", "error")
                 return False
             
             self.log_to_console(f"Data validation passed: {len(self.shipment_data)} records validated", "success")
             return True
             
         except Exception as e:
-            self.log_to_console(f"Data validation error: {str(e)}", "error")
+            self.log_to_console(f"Data validation error: {str(e)}", "error", trusted=False)
             return False
     
     def setup_themes(self):
@@ -258,75 +358,37 @@ class PlacardGeneratorGUI:
                 dpg.add_theme_style(dpg.mvStyleVar_FrameBorderSize, 1)
                 dpg.add_theme_style(dpg.mvStyleVar_ButtonTextAlign, 0.5, 0.5)  # Center button text
         
-        # Standardized button base styling
-        button_base_styles = {
-            'rounding': 3,
-            'padding': (12, 8),
-            'text_align': (0.5, 0.5),
-            'text_color': [255, 255, 255],  # White text for all buttons
-        }
-        
-        # Success button theme - Standardized green
-        with dpg.theme() as success_theme:
-            with dpg.theme_component(dpg.mvButton):
-                dpg.add_theme_color(dpg.mvThemeCol_Button, [34, 139, 34])      # Standard green
-                dpg.add_theme_color(dpg.mvThemeCol_ButtonHovered, [44, 149, 44])  # +10 lighter
-                dpg.add_theme_color(dpg.mvThemeCol_ButtonActive, [24, 129, 24])   # -10 darker
-                dpg.add_theme_color(dpg.mvThemeCol_Text, button_base_styles['text_color'])
-                dpg.add_theme_style(dpg.mvStyleVar_FrameRounding, button_base_styles['rounding'])
-                dpg.add_theme_style(dpg.mvStyleVar_FramePadding, *button_base_styles['padding'])
-                dpg.add_theme_style(dpg.mvStyleVar_ButtonTextAlign, *button_base_styles['text_align'])
-        
-        # Warning button theme - Standardized orange
-        with dpg.theme() as warning_theme:
-            with dpg.theme_component(dpg.mvButton):
-                dpg.add_theme_color(dpg.mvThemeCol_Button, [255, 140, 0])      # Standard orange
-                dpg.add_theme_color(dpg.mvThemeCol_ButtonHovered, [255, 150, 10])  # +10 lighter
-                dpg.add_theme_color(dpg.mvThemeCol_ButtonActive, [245, 130, 0])    # -10 darker
-                dpg.add_theme_color(dpg.mvThemeCol_Text, button_base_styles['text_color'])
-                dpg.add_theme_style(dpg.mvStyleVar_FrameRounding, button_base_styles['rounding'])
-                dpg.add_theme_style(dpg.mvStyleVar_FramePadding, *button_base_styles['padding'])
-                dpg.add_theme_style(dpg.mvStyleVar_ButtonTextAlign, *button_base_styles['text_align'])
-        
-        # Danger button theme - Standardized red
-        with dpg.theme() as danger_theme:
-            with dpg.theme_component(dpg.mvButton):
-                dpg.add_theme_color(dpg.mvThemeCol_Button, [220, 53, 69])      # Standard red
-                dpg.add_theme_color(dpg.mvThemeCol_ButtonHovered, [230, 63, 79])  # +10 lighter
-                dpg.add_theme_color(dpg.mvThemeCol_ButtonActive, [210, 43, 59])   # -10 darker
-                dpg.add_theme_color(dpg.mvThemeCol_Text, button_base_styles['text_color'])
-                dpg.add_theme_style(dpg.mvStyleVar_FrameRounding, button_base_styles['rounding'])
-                dpg.add_theme_style(dpg.mvStyleVar_FramePadding, *button_base_styles['padding'])
-                dpg.add_theme_style(dpg.mvStyleVar_ButtonTextAlign, *button_base_styles['text_align'])
-        
-        # Primary action button theme - Standardized blue
-        with dpg.theme() as primary_theme:
-            with dpg.theme_component(dpg.mvButton):
-                dpg.add_theme_color(dpg.mvThemeCol_Button, [0, 123, 255])      # Standard blue
-                dpg.add_theme_color(dpg.mvThemeCol_ButtonHovered, [10, 133, 255])  # +10 lighter
-                dpg.add_theme_color(dpg.mvThemeCol_ButtonActive, [0, 113, 245])    # -10 darker
-                dpg.add_theme_color(dpg.mvThemeCol_Text, button_base_styles['text_color'])
-                dpg.add_theme_style(dpg.mvStyleVar_FrameRounding, button_base_styles['rounding'])
-                dpg.add_theme_style(dpg.mvStyleVar_FramePadding, *button_base_styles['padding'])
-                dpg.add_theme_style(dpg.mvStyleVar_ButtonTextAlign, *button_base_styles['text_align'])
-        
         self.main_theme = main_theme
-        self.success_theme = success_theme
-        self.warning_theme = warning_theme
-        self.danger_theme = danger_theme
-        self.primary_theme = primary_theme
         
+        # Button themes - standard color, +10 lighter on hover, -10 darker when pressed
+        self.success_theme = self._make_button_theme([34, 139, 34])   # Standard green
+        self.warning_theme = self._make_button_theme([255, 140, 0])   # Standard orange
+        self.danger_theme = self._make_button_theme([220, 53, 69])    # Standard red
+        self.primary_theme = self._make_button_theme([0, 123, 255])   # Standard blue
+        
+    @staticmethod
+    def _make_button_theme(rgb: List[int]) -> int:
+        """Build a button theme around a base color with the standard button styling"""
+        hovered = [min(c + 10, 255) for c in rgb]
+        active = [max(c - 10, 0) for c in rgb]
+        with dpg.theme() as theme:
+            with dpg.theme_component(dpg.mvButton):
+                dpg.add_theme_color(dpg.mvThemeCol_Button, rgb)
+                dpg.add_theme_color(dpg.mvThemeCol_ButtonHovered, hovered)
+                dpg.add_theme_color(dpg.mvThemeCol_ButtonActive, active)
+                dpg.add_theme_color(dpg.mvThemeCol_Text, [255, 255, 255])  # White text for all buttons
+                dpg.add_theme_style(dpg.mvStyleVar_FrameRounding, 3)
+                dpg.add_theme_style(dpg.mvStyleVar_FramePadding, 12, 8)
+                dpg.add_theme_style(dpg.mvStyleVar_ButtonTextAlign, 0.5, 0.5)
+        return theme
+    
     def setup_fonts(self):
         """Setup custom fonts with comprehensive error handling"""
         try:
             # Create a font registry
             with dpg.font_registry():
                 # Try to load system fonts with fallbacks
-                font_paths = [
-                    "C:/Windows/Fonts/segoeui.ttf",     # Windows
-                    "/System/Library/Fonts/Arial.ttf",  # macOS
-                    "/usr/share/fonts/truetype/dejavu/DejaVuSans.ttf"  # Linux
-                ]
+                font_paths = [regular for regular, _ in _FONT_CANDIDATES]
                 
                 default_font = None
                 large_font = None
@@ -341,15 +403,11 @@ class PlacardGeneratorGUI:
                             self.log_to_console(f"Loaded fonts from: {font_path}", "success")
                             break
                         except Exception as e:
-                            self.log_to_console(f"Failed to load font {font_path}: {e}", "warning")
+                            self.log_to_console(f"Failed to load font {font_path}: {e}", "warning", trusted=False)
                             continue
                 
                 # Try to load bold font
-                bold_paths = [
-                    "C:/Windows/Fonts/segoeuib.ttf",
-                    "/System/Library/Fonts/Arial Bold.ttf",
-                    "/usr/share/fonts/truetype/dejavu/DejaVuSans-Bold.ttf"
-                ]
+                bold_paths = [bold for _, bold in _FONT_CANDIDATES]
                 
                 for bold_path in bold_paths:
                     if os.path.exists(bold_path):
@@ -373,7 +431,7 @@ class PlacardGeneratorGUI:
                 self.log_to_console("Warning: No custom fonts loaded, using system defaults", "warning")
                 
         except Exception as e:
-            self.log_to_console(f"Font setup error: {str(e)}", "error")
+            self.log_to_console(f"Font setup error: {str(e)}", "error", trusted=False)
             # Set None values to prevent binding errors
             self.default_font = None
             self.large_font = None
@@ -385,53 +443,57 @@ class PlacardGeneratorGUI:
             try:
                 dpg.bind_item_font(item, font)
             except Exception as e:
-                self.log_to_console(f"Font binding failed for item: {e}", "warning")
-        
-    def update_status(self, message: str, status_type: str = "info"):
-        """Update the status bar with a message"""
-        if dpg.does_item_exist("status_text"):
-            dpg.set_value("status_text", f"[{datetime.now().strftime('%H:%M:%S')}] {message}")
+                self.log_to_console(f"Font binding failed for item: {e}", "warning", trusted=False)
+        
+    def _clock_time(self) -> str:
+        """Current time as HH:MM:SS for the status bar and console
+        
+        Formatted once per second and reused by every message in between.
+        """
+        second = int(time.time())
+        cached_second, clock = self._clock_cache
+        if second != cached_second:
+            t = time.localtime(second)
+            clock = f"{t.tm_hour:02d}:{t.tm_min:02d}:{t.tm_sec:02d}"
+            self._clock_cache = (second, clock)
+        return clock
+    
+    def update_status(self, message: str, status_type: str = "info", trusted: bool = True):
+        """Update the status bar with a message; trusted is passed on to log_to_console"""
+        if self._status_text_id is not None:
+            dpg.set_value(self._status_text_id, f"[{self._clock_time()}] {message}")
             
             # Change color based on status type
-            if status_type == "success":
-                color = self.colors['success']
-            elif status_type == "warning":
-                color = self.colors['warning']
-            elif status_type == "error":
-                color = self.colors['danger']
-            else:
-                color = [255, 255, 255]  # White for info
-                
-            dpg.configure_item("status_text", color=color)
+            color = self._status_colors.get(status_type, [255, 255, 255])  # White for info
+            dpg.configure_item(self._status_text_id, color=color)
         
         # Also log to console
-        self.log_to_console(message, status_type)
+        self.log_to_console(message, status_type, trusted)
     
-    def log_to_console(self, message: str, log_type: str = "info"):
-        """Add a message to the console log with security validation and memory management"""
+    def log_to_console(self, message: str, log_type: str = "info", trusted: bool = True):
+        """Add a message to the console log with security validation and memory management
+        
+        Messages built by the application itself are trusted and logged as is.
+        Callers pass trusted=False when the message carries user input or
+        exception text; those messages are rate limited and validated first.
+        """
         try:
-            # Rate limiting for console logs
-            if not self.rate_limiter.allow_operation():
-                return
-            
-            # Validate and sanitize input
-            if not InputValidator.validate_text_field(message, max_length=1000):
-                message = "INVALID_LOG_MESSAGE"
-                log_type = "error"
-                security_logger.warning("Invalid log message filtered")
-            
-            timestamp = datetime.now().strftime('%H:%M:%S')
-            log_entry = f"[{timestamp}] {message}"
+            if not trusted:
+                # Rate limiting for console logs
+                if not self.rate_limiter.allow_operation():
+                    return
+                
+                # Validate and sanitize input
+                if not InputValidator.validate_text_field(message, max_length=1000):
+                    message = "INVALID_LOG_MESSAGE"
+                    log_type = "error"
+                    security_logger.warning("Invalid log message filtered")
             
             # Add to console logs - deque automatically handles size limit
-            self.console_logs.append({
-                'message': log_entry,
-                'type': log_type,
-                'timestamp': timestamp
-            })
+            self.console_logs.append(f"[{self._clock_time()}] {message}")
             
-            # Update console display if it exists
-            self.update_console_display()
+            # Redraw the console on the next frame, however many messages arrive before it
+            self._console_dirty = True
             
             # Log to appropriate logger based on type
             if log_type == "error":
@@ -439,69 +501,78 @@ class PlacardGeneratorGUI:
             elif log_type == "warning":
                 gui_logger.warning(message)
             elif log_type == "success":
-                gui_logger.info(f"SUCCESS: {message}")
+                gui_logger.info("SUCCESS: %s", message)
             else:
                 gui_logger.info(message)
-            
-            # Periodic memory cleanup
-            current_time = time.time()
-            if current_time - self._last_cleanup > self._memory_cleanup_interval:
-                self._cleanup_memory()
-                self._last_cleanup = current_time
                 
         except Exception as e:
             # Fallback logging to prevent crash
             print(f"Console logging error: {e}")
-            gui_logger.error(f"Console logging failed: {e}")
+            gui_logger.error("Console logging failed: %s", e)
     
     def _cleanup_memory(self):
         """Perform periodic memory cleanup"""
         try:
-            # Force garbage collection
-            gc.collect()
-            
-            # Clean up weak references
-            dead_refs = [ref for ref in self._weak_references if ref() is None]
-            for ref in dead_refs:
-                self._weak_references.discard(ref)
+            # Collect the youngest generation only; the automatic collector
+            # already takes care of the older ones
+            gc.collect(generation=0)
             
             # Limit data structures if they get too large
             if len(self.shipment_data) > SecurityConfig.MAX_RECORDS_PER_BATCH:
                 gui_logger.warning("Large dataset detected, consider data cleanup")
             
             # Log memory usage if psutil is available
-            try:
-                import psutil
-                process = psutil.Process()
-                memory_mb = process.memory_info().rss / 1024 / 1024
+            if _PROCESS is not None:
+                memory_mb = _PROCESS.memory_info().rss / (1 << 20)
                 self._memory_usage.append(memory_mb)
                 
                 if len(self._memory_usage) > 10:
                     avg_memory = sum(self._memory_usage) / len(self._memory_usage)
                     if memory_mb > avg_memory * 1.5:  # 50% increase
-                        gui_logger.warning(f"Memory usage spike detected: {memory_mb:.1f}MB")
-            except ImportError:
-                # psutil not available, skip memory monitoring
-                pass
+                        gui_logger.warning("Memory usage spike detected: %.1fMB", memory_mb)
             
         except Exception as e:
-            gui_logger.error(f"Memory cleanup failed: {e}")
+            gui_logger.error("Memory cleanup failed: %s", e)
     
     def update_console_display(self):
         """Update the console text display"""
-        if dpg.does_item_exist("console_text"):
+        if self._console_text_id is not None:
             # Create console text from logs
-            console_text = "\n".join([log['message'] for log in self.console_logs])
-            dpg.set_value("console_text", console_text)
+            console_text = "\n".join(self.console_logs)
+            dpg.set_value(self._console_text_id, console_text)
             
             # Auto-scroll to bottom
-            if dpg.does_item_exist("console_window"):
-                dpg.set_y_scroll("console_window", -1)  # Scroll to bottom
+            if self._console_window_id is not None:
+                dpg.set_y_scroll(self._console_window_id, -1)  # Scroll to bottom
+    
+    def _run_ui_tasks(self):
+        """Run the callbacks queued by worker threads on the GUI thread"""
+        while True:
+            try:
+                task = self._ui_tasks.get_nowait()
+            except queue.Empty:
+                return
+            task()
+    
+    def _render_loop(self):
+        """Run the Dear PyGui main loop, redrawing the console once per frame when it changed"""
+        while dpg.is_dearpygui_running():
+            self._run_ui_tasks()
+            if self._console_dirty:
+                self._console_dirty = False
+                self.update_console_display()
+            
+            # Periodic memory cleanup
+            current_time = time.time()
+            if current_time - self._last_cleanup > self._memory_cleanup_interval:
+                self._cleanup_memory()
+                self._last_cleanup = current_time
+            
+            dpg.render_dearpygui_frame()
     
     def clear_console_callback(self, sender, app_data):
         """Clear the console log"""
         self.console_logs.clear()
-        self.update_console_display()
         self.log_to_console("Console cleared", "info")
     
     def load_data_callback(self, sender, app_data):
@@ -519,6 +590,7 @@ class PlacardGeneratorGUI:
             # Rate limiting check
             if not self.rate_limiter.allow_operation():
                 self.update_status("Rate limit exceeded. Please wait before retrying.", "warning")
+                self._end_data_load()
                 return
             
             # Disable load button during loading
@@ -526,73 +598,58 @@ class PlacardGeneratorGUI:
                                      dpg.configure_item, "load_data_btn", enabled=False, label="Loading...")
             
             # Clear previous data securely
-            self.shipment_data.clear()
+            self._set_shipment_data([])
             self.filtered_data.clear()
             self.selected_shipments.clear()
             self.data_loaded = False
             
-            # Load data with comprehensive error handling
+            # Parse the workbook and build the rows off the GUI thread;
+            # _finish_data_load picks the result up on the next frame
             self.log_to_console("Starting data loading process...", "info")
+            future = self._load_executor.submit(self._load_shipment_rows)
+            future.add_done_callback(
+                lambda done: self._ui_tasks.put(lambda: self._finish_data_load(done)))
             
-            # Check if Data directory exists
-            data_dir = os.path.join(os.getcwd(), "Data")
-            if not os.path.exists(data_dir):
-                raise FileNotFoundError(f"Data directory not found: {data_dir}")
-            
-            # Check for Excel files in Data directory
-            excel_files = [f for f in os.listdir(data_dir) if f.endswith(('.xlsx', '.xls'))]
-            if not excel_files:
-                raise FileNotFoundError("No Excel files found in Data directory")
-            
-            self.log_to_console(f"Found {len(excel_files)} Excel file(s) in Data directory", "info")
+        except Exception as e:
+            self.update_status(f"Error loading data: {str(e)}", "error", trusted=False)
+            self.log_to_console(f"Exception during data loading: {str(e)}", "error", trusted=False)
+            gui_logger.error("Data loading failed: %s", e, exc_info=True)
+            self._end_data_load()
+    
+    def _load_shipment_rows(self) -> Optional[List[Dict[str, Any]]]:
+        """Load the Excel data and build the table rows (runs on the load worker)
+        
+        Returns None when the generator could not load the data.
+        """
+        # Check if Data directory exists
+        data_dir = os.path.join(os.getcwd(), "Data")
+        if not os.path.exists(data_dir):
+            raise FileNotFoundError(f"Data directory not found: {data_dir}")
+        
+        # Check for Excel files in Data directory
+        excel_files = [f for f in os.listdir(data_dir) if f.endswith(('.xlsx', '.xls'))]
+        if not excel_files:
+            raise FileNotFoundError("No Excel files found in Data directory")
+        
+        self.log_to_console(f"Found {len(excel_files)} Excel file(s) in Data directory", "info")
+        
+        if not self.generator.load_and_prepare_data():
+            return None
+        
+        self.log_to_console("Excel data loaded successfully", "success")
+        # Get all shipments with their details
+        all_shipments = self.generator.get_all_unique_shipments()
+        self.log_to_console(f"Found {len(all_shipments)} unique shipments", "info")
+        
+        return self._summarize_shipments(all_shipments)
+    
+    def _finish_data_load(self, future: Future):
+        """Show the rows built by _load_shipment_rows (runs on the GUI thread)"""
+        try:
+            shipment_rows = future.result()
             
-            if self.generator.load_and_prepare_data():
-                self.log_to_console("Excel data loaded successfully", "success")
-                # Get all shipments with their details
-                all_shipments = self.generator.get_all_unique_shipments()
-                self.log_to_console(f"Found {len(all_shipments)} unique shipments", "info")
-                
-                self.shipment_data = []
-                for shipment in all_shipments:
-                    if self.generator.df is not None:
-                        # Use the same conversion logic as get_all_unique_shipments()
-                        df_shipment_clean = self.generator.df['Shipment Nbr'].astype(float).astype(int).astype(str)
-                        shipment_df = self.generator.df[df_shipment_clean == str(shipment)]
-                        
-                        if not shipment_df.empty:
-                            first_record = shipment_df.iloc[0]
-                            do_count = len(shipment_df)
-                            
-                            # Get all DOs for this shipment
-                            do_series = cast(pd.Series, shipment_df['DO #'])
-                            do_numbers = do_series.unique().tolist()
-                            do_list = ', '.join([str(int(do)) for do in do_numbers if pd.notna(do)])
-                            
-                            # Get total original quantity
-                            qty_series = cast(pd.Series, shipment_df['Original Qty'])
-                            total_qty = qty_series.sum()
-                            
-                            # Get all POs for this shipment
-                            po_series = cast(pd.Series, shipment_df['PO'])
-                            po_list = po_series.dropna().unique().tolist()
-                            po_display = ', '.join([str(po) for po in po_list[:3]])  # Show first 3 POs
-                            if len(po_list) > 3:
-                                po_display += f" (+{len(po_list) - 3} more)"
-                            
-                            self.shipment_data.append({
-                                'selected': False,
-                                'shipment_nbr': shipment,
-                                'do_numbers': do_list,
-                                'do_count': do_count,
-                                'ship_to': str(first_record.get('Ship To', 'N/A')),
-                                'po': po_display if po_display else 'N/A',
-                                'vas': str(first_record.get('VAS', 'N/A')),
-                                'original_qty': str(int(total_qty)) if pd.notna(total_qty) else '0',
-                                'label_type': str(first_record.get('Label Type', 'N/A')),
-                                'order_type': str(first_record.get('Order Type', 'N/A')),
-                                'pmt_term': str(first_record.get('Pmt Term', 'N/A')),
-                                'start_ship': str(first_record.get('Start Ship', 'N/A'))
-                            })
+            if shipment_rows is not None:
+                self._set_shipment_data(shipment_rows)
                 
                 # Initialize filtered data
                 self.filtered_data = self.shipment_data.copy()
@@ -627,25 +684,100 @@ class PlacardGeneratorGUI:
                 self.log_to_console("Data loading failed - check Data folder", "error")
                 
         except SecurityError as e:
-            self.update_status(f"Security error loading data: {str(e)}", "error")
-            self.log_to_console(f"Security violation during data loading: {str(e)}", "error")
-            security_logger.error(f"Data loading security error: {e}")
+            self.update_status(f"Security error loading data: {str(e)}", "error", trusted=False)
+            self.log_to_console(f"Security violation during data loading: {str(e)}", "error", trusted=False)
+            security_logger.error("Data loading security error: %s", e)
             
         except Exception as e:
-            self.update_status(f"Error loading data: {str(e)}", "error")
-            self.log_to_console(f"Exception during data loading: {str(e)}", "error")
-            gui_logger.error(f"Data loading failed: {e}", exc_info=True)
+            self.update_status(f"Error loading data: {str(e)}", "error", trusted=False)
+            self.log_to_console(f"Exception during data loading: {str(e)}", "error", trusted=False)
+            gui_logger.error("Data loading failed: %s", e, exc_info=True)
             
         finally:
-            # Re-enable load button and reset processing state
-            dpg.configure_item("load_data_btn", enabled=True, label="Load Data")
-            with self._processing_lock:
-                self.is_processing = False
+            self._end_data_load()
+    
+    def _end_data_load(self):
+        """Re-enable the load button and reset the processing state"""
+        dpg.configure_item("load_data_btn", enabled=True, label="Load Data")
+        with self._processing_lock:
+            self.is_processing = False
+    
+    def _summarize_shipments(self, shipments: List[str]) -> List[Dict[str, Any]]:
+        """Build the table row for each shipment with one grouped pass over the dataset
+        
+        The rows are grouped by shipment number once; the DO and PO lists,
+        totals and first-record fields are all taken from that grouping
+        instead of filtering the dataset again for every shipment.
+        """
+        df = self.generator.df
+        if df is None or df.empty:
+            return []
+        
+        # Digit-string shipment key per row; the categorical column is
+        # stringified once per distinct shipment, not once per row
+        keys = df['Shipment Nbr'].cat.rename_categories(lambda value: str(int(value)))
+        groups = df.groupby(keys, observed=True, sort=False)
+        
+        # First record's text fields and start date; missing text reads as
+        # NaN, as it does when the record is looked up on its own
+        text_columns = ['Ship To', 'VAS', 'Label Type', 'Order Type', 'Pmt Term']
+        firsts = groups.head(1)
+        first_text = firsts[text_columns].astype(object).fillna(float('nan'))
+        first_records = dict(zip(keys[firsts.index],
+                                 zip(first_text.to_numpy(), firsts['Start Ship'].astype(object))))
+        row_counts = groups.size().to_dict()
+        total_qtys = groups['Original Qty'].sum().to_dict()
+        
+        # Distinct DOs and POs per shipment, in order of first appearance,
+        # stringified column-wide so each shipment only has to join them
+        do_series = cast(pd.Series, df['DO #']).dropna().astype('int64').astype(str)
+        do_lists = do_series.groupby(keys, observed=True, sort=False).unique().to_dict()
+        po_series = cast(pd.Series, df['PO']).dropna().astype(str)
+        po_lists = po_series.groupby(keys, observed=True, sort=False).unique().to_dict()
+        
+        shipment_rows = []
+        for shipment in shipments:
+            first_record = first_records.get(shipment)
+            if first_record is None:
+                continue
+            (ship_to, vas, label_type, order_type, pmt_term), start_ship = first_record
+            
+            po_list = po_lists.get(shipment, [])
+            po_display = ', '.join(po_list[:3])  # Show first 3 POs
+            if len(po_list) > 3:
+                po_display += f" (+{len(po_list) - 3} more)"
+            
+            total_qty = total_qtys[shipment]
+            shipment_rows.append({
+                'selected': False,
+                'shipment_nbr': shipment,
+                'do_numbers': ', '.join(do_lists.get(shipment, [])),
+                'do_count': row_counts[shipment],
+                'ship_to': str(ship_to),
+                'po': po_display if po_display else 'N/A',
+                'vas': str(vas),
+                'original_qty': str(int(total_qty)) if pd.notna(total_qty) else '0',
+                'label_type': str(label_type),
+                'order_type': str(order_type),
+                'pmt_term': str(pmt_term),
+                'start_ship': str(start_ship)
+            })
+        return shipment_rows
     
     def search_callback(self, sender, app_data):
-        """Callback for search functionality"""
+        """Callback for search functionality
+        
+        The filters are reapplied once typing pauses: each keystroke restarts
+        the debounce timer, which then queues apply_all_filters for the GUI
+        thread.
+        """
         self.search_text = app_data.lower().strip()
-        self.apply_all_filters()
+        if self._search_timer is not None:
+            self._search_timer.cancel()
+        self._search_timer = threading.Timer(self._search_debounce_seconds,
+                                             self._ui_tasks.put, args=(self.apply_all_filters,))
+        self._search_timer.daemon = True
+        self._search_timer.start()
     
     def column_filter_callback(self, sender, app_data, user_data):
         """Callback for column-specific filters"""
@@ -656,53 +788,75 @@ class PlacardGeneratorGUI:
         # Apply all filters
         self.apply_all_filters()
     
-    def apply_all_filters(self):
-        """Apply both search and multi-select column filters"""
-        initial_count = len(self.shipment_data)
-        filtered_data = self.shipment_data.copy()
-        self.log_to_console(f"Applying filters to {initial_count} shipments", "info")
-        
-        # Apply main search filter
+    def _set_shipment_data(self, shipment_rows: List[Dict[str, Any]]) -> None:
+        """Replace the table rows and the columnar copy of their filtered and validated fields
+        
+        The search compares lowercased text and the multi-select filters
+        compare stripped text, with the DO and PO columns compared part by
+        part, so those values are prepared here once instead of on every
+        filter change. The filter values are factorized into integer codes,
+        so a filter only has to look at each distinct value once.
+        """
+        self.shipment_data = shipment_rows
+        self._shipment_positions = {row['shipment_nbr']: i for i, row in enumerate(shipment_rows)}
+        df = pd.DataFrame.from_records(shipment_rows, columns=[*self.column_filters, 'original_qty'])
+        self.shipment_df = df
+        
+        filter_values = {}
+        for column in self.column_filters:
+            values = df[column].astype(str).str.strip()
+            rows = None
+            if column in ['do_numbers', 'po']:
+                values = values.str.split(',').explode().str.strip()
+                rows = values.index.to_numpy()
+            codes, categories = pd.factorize(values)
+            filter_values[column] = _FilterColumn(codes, categories, rows)
+        self._filter_values = filter_values
+        # The searchable fields of each row, lowercased and joined by newlines
+        # (which the single-line search box cannot contain), so a search is
+        # one substring test per row
+        search_fields = df[['shipment_nbr', 'do_numbers', 'ship_to', 'po']].astype(str)
+        self._search_haystack = search_fields['shipment_nbr'].str.cat(
+            [search_fields[column] for column in ('do_numbers', 'ship_to', 'po')], sep='\n').str.lower()
+    
+    def _filter_mask(self) -> np.ndarray:
+        """Boolean mask over shipment_df of the rows passing the search and column filters"""
+        df = self.shipment_df
+        mask = np.ones(len(df), dtype=bool)
+        if df.empty:
+            return mask
+        
+        # Main search: substring of any of the searchable fields
         if self.search_text:
-            temp_filtered = []
-            for shipment in filtered_data:
-                search_fields = [
-                    shipment['shipment_nbr'],
-                    shipment['do_numbers'],
-                    shipment['ship_to'],
-                    shipment['po']
-                ]
-                if any(self.search_text in str(field).lower() for field in search_fields):
-                    temp_filtered.append(shipment)
-            filtered_data = temp_filtered
+            mask &= self._search_haystack.str.contains(self.search_text, regex=False).to_numpy(dtype=bool)
         
-        # Apply multi-select column filters
+        # Multi-select column filters
         for column, selected_values in self.multi_select_filters.items():
-            if selected_values:  # If any values are selected for this column
-                print(f"DEBUG: Processing filter for {column} with selected values: {list(selected_values)}")
-                temp_filtered = []
-                for shipment in filtered_data:
-                    shipment_value = str(shipment.get(column, '')).strip()
-                    
-                    # Special handling for comma-separated values (DO numbers, POs)
-                    if column in ['do_numbers', 'po'] and ',' in shipment_value:
-                        # Split comma-separated values and check if any match
-                        shipment_values = [v.strip() for v in shipment_value.split(',')]
-                        print(f"DEBUG: Checking {column} values {shipment_values} against selected {list(selected_values)}")
-                        if any(selected_val in selected_values for selected_val in shipment_values):
-                            temp_filtered.append(shipment)
-                            print(f"DEBUG: Match found! Keeping shipment {shipment['shipment_nbr']}")
-                    else:
-                        # Direct match for single values
-                        print(f"DEBUG: Checking {column} value '{shipment_value}' against selected {list(selected_values)}")
-                        if shipment_value in selected_values:
-                            temp_filtered.append(shipment)
-                            print(f"DEBUG: Match found! Keeping shipment {shipment['shipment_nbr']}")
-                
-                filtered_data = temp_filtered
-                print(f"DEBUG: After {column} filter: {len(filtered_data)} shipments remaining")
+            if not selected_values:  # Nothing selected: column is not filtered
+                continue
+            gui_logger.debug("Processing filter for %s with selected values: %s", column, selected_values)
+            codes, categories, rows = self._filter_values[column]
+            # Look up each row's code in a table of which distinct values are
+            # selected; only the selected values are looked up in the categories
+            allowed = np.zeros(len(categories), dtype=bool)
+            positions = categories.get_indexer(list(selected_values))
+            allowed[positions[positions >= 0]] = True
+            matched = allowed[codes]
+            if rows is not None:
+                # Comma-separated values (DO numbers, POs) match if any part does
+                matched = np.bincount(rows, weights=matched, minlength=len(df)) > 0
+            mask &= matched
+            if gui_logger.isEnabledFor(logging.DEBUG):
+                gui_logger.debug("After %s filter: %d shipments remaining", column, int(mask.sum()))
+        
+        return mask
+    
+    def apply_all_filters(self):
+        """Apply both search and multi-select column filters"""
+        self.log_to_console(f"Applying filters to {len(self.shipment_data)} shipments", "info")
         
-        self.filtered_data = filtered_data
+        shipment_data = self.shipment_data
+        self.filtered_data = [shipment_data[i] for i in np.flatnonzero(self._filter_mask())]
         
         # Log filter results
         self.log_to_console(f"Filter results: {len(self.filtered_data)} of {len(self.shipment_data)} shipments", "info")
@@ -710,7 +864,7 @@ class PlacardGeneratorGUI:
         if active_filters > 0:
             self.log_to_console(f"Active filters: {active_filters} column filters", "info")
         if self.search_text:
-            self.log_to_console(f"Search filter: '{self.search_text}'", "info")
+            self.log_to_console(f"Search filter: '{self.search_text}'", "info", trusted=False)
         
         self.refresh_table()
         self.update_selection_count()
@@ -750,45 +904,33 @@ class PlacardGeneratorGUI:
         if not self.shipment_data:
             return
         
-        print(f"DEBUG populate_dropdown_options: Processing {len(self.shipment_data)} shipments")
-        
-        # Initialize dropdown options as dict of sets temporarily
-        temp_options = {
-            'shipment_nbr': set(),
-            'do_numbers': set(),
-            'ship_to': set(),
-            'po': set(),
-            'vas': set(),
-            'label_type': set(),
-            'order_type': set(),
-            'pmt_term': set()
-        }
-        
-        # Collect unique values from all data
-        for i, shipment in enumerate(self.shipment_data):
-            if i < 3:  # Debug first few shipments
-                print(f"DEBUG shipment {i}: {shipment}")
-            for key in temp_options.keys():
-                if key in shipment:
-                    value = str(shipment[key]).strip()
-                    if value and value != 'N/A':
-                        # For DO numbers and PO, split comma-separated values
-                        if key in ['do_numbers', 'po']:
-                            parts = [part.strip() for part in value.split(',')]
-                            for part in parts:
-                                if part and not part.endswith('...'):
-                                    temp_options[key].add(part)
-                        else:
-                            temp_options[key].add(value)
-        
-        # Convert sets to sorted lists and add "All" option
+        gui_logger.debug("populate_dropdown_options: Processing %d shipments", len(self.shipment_data))
+        for i, shipment in enumerate(self.shipment_data[:3]):  # Debug first few shipments
+            gui_logger.debug("shipment %d: %s", i, shipment)
+        
+        # Collect unique values from all data: the distinct stripped (and for
+        # DO numbers and PO, comma-split) values prepared for the column filters
+        temp_options = {}
+        for key, (codes, categories, rows) in self._filter_values.items():
+            options = [value for value in categories if value and value != 'N/A']
+            if rows is not None:
+                # Skip truncated parts. 'N/A' is a shipment with no DOs/POs,
+                # unless it is one part of a longer list
+                options = [value for value in options if not value.endswith('...')]
+                if 'N/A' in categories:
+                    in_longer_list = np.bincount(rows)[rows] > 1
+                    if (in_longer_list & (codes == categories.get_loc('N/A'))).any():
+                        options.append('N/A')
+            temp_options[key] = options
+        
+        # Sort the unique values and add "All" option
         self.dropdown_options = {}
         for key in temp_options:
-            sorted_options = sorted(list(temp_options[key]))
+            sorted_options = sorted(temp_options[key])
             self.dropdown_options[key] = ["All"] + sorted_options
-            print(f"DEBUG dropdown options for {key}: {len(sorted_options)} options - {sorted_options[:5] if sorted_options else []}")
+            gui_logger.debug("dropdown options for %s: %d options - %s", key, len(sorted_options), sorted_options[:5])
         
-        print("DEBUG populate_dropdown_options completed")
+        gui_logger.debug("populate_dropdown_options completed")
     
     def show_multi_select_popup(self, sender, app_data, user_data):
         """Show multi-select filter popup"""
@@ -984,14 +1126,16 @@ class PlacardGeneratorGUI:
         """Toggle selection of a filter option"""
         column_name, option = user_data
         
-        print(f"DEBUG toggle_filter_option: {column_name} = {option}, checked = {app_data}")
+        gui_logger.debug("toggle_filter_option: %s = %s, checked = %s", column_name, option, app_data)
         
         if app_data:  # Checked
             self.multi_select_filters[column_name].add(option)
-            print(f"DEBUG: Added {option} to {column_name} filter. Now has: {list(self.multi_select_filters[column_name])}")
+            gui_logger.debug("Added %s to %s filter. Now has: %s",
+                             option, column_name, self.multi_select_filters[column_name])
         else:  # Unchecked
             self.multi_select_filters[column_name].discard(option)
-            print(f"DEBUG: Removed {option} from {column_name} filter. Now has: {list(self.multi_select_filters[column_name])}")
+            gui_logger.debug("Removed %s from %s filter. Now has: %s",
+                             option, column_name, self.multi_select_filters[column_name])
         
         # Update selected count
         count_tag = f"selected_count_{column_name}"
@@ -1081,189 +1225,67 @@ class PlacardGeneratorGUI:
                 # Configure the combo with new items
                 dpg.configure_item(tag, items=self.dropdown_options[key])
         
-    def load_data_thread(self):
-        """Load data in a separate thread"""
-        try:
-            print("DEBUG: Starting data load...")  # Debug print
-            if self.generator.load_and_prepare_data():
-                # Get all shipments with their details
-                all_shipments = self.generator.get_all_unique_shipments()
-                print(f"DEBUG: Found {len(all_shipments)} shipments")  # Debug print
-                
-                temp_shipment_data = []
-                for shipment in all_shipments:
-                    if self.generator.df is not None:
-                        shipment_df = self.generator.df[
-                            self.generator.df['Shipment Nbr'].astype(str) == shipment
-                        ]
-                        if not shipment_df.empty:
-                            first_record = shipment_df.iloc[0]
-                            do_count = len(shipment_df)
-                            
-                            # Get all DOs for this shipment
-                            do_series = cast(pd.Series, shipment_df['DO #'])
-                            do_numbers = do_series.unique().tolist()
-                            do_list = ', '.join([str(int(do)) for do in do_numbers if pd.notna(do)])
-                            
-                            # Get total original quantity
-                            qty_series = cast(pd.Series, shipment_df['Original Qty'])
-                            total_qty = qty_series.sum()
-                            
-                            # Get all POs for this shipment
-                            po_series = cast(pd.Series, shipment_df['PO'])
-                            po_list = po_series.dropna().unique().tolist()
-                            po_display = ', '.join([str(po) for po in po_list[:3]])  # Show first 3 POs
-                            if len(po_list) > 3:
-                                po_display += f" (+{len(po_list) - 3} more)"
-                            
-                            temp_shipment_data.append({
-                                'selected': False,
-                                'shipment_nbr': shipment,
-                                'do_numbers': do_list,
-                                'do_count': do_count,
-                                'ship_to': str(first_record.get('Ship To', 'N/A')),
-                                'po': po_display if po_display else 'N/A',
-                                'vas': str(first_record.get('VAS', 'N/A')),
-                                'original_qty': str(int(total_qty)) if pd.notna(total_qty) else '0',
-                                'label_type': str(first_record.get('Label Type', 'N/A')),
-                                'order_type': str(first_record.get('Order Type', 'N/A')),
-                                'pmt_term': str(first_record.get('Pmt Term', 'N/A')),
-                                'start_ship': str(first_record.get('Start Ship', 'N/A'))
-                            })
-                
-                print(f"DEBUG: Prepared {len(temp_shipment_data)} shipment records")  # Debug print
-                
-                # Store data and schedule GUI update on main thread
-                self.shipment_data = temp_shipment_data
-                self.data_loaded = True
-                print("DEBUG: Data loading completed successfully")  # Debug print
-                
-            else:
-                print("DEBUG: Data loading failed")  # Debug print
-                self.data_loaded = False
-                self.load_error = "Failed to load data. Check Data folder and file format."
-                
-        except Exception as e:
-            print(f"DEBUG: Exception during data loading: {e}")  # Debug print
-            self.data_loaded = False
-            self.load_error = f"Error loading data: {str(e)}"
-    
-    def check_loading_completion(self):
-        """Check if data loading is complete and update GUI accordingly"""
-        def check():
-            print(f"DEBUG: Checking loading completion. data_loaded = {getattr(self, 'data_loaded', 'not set')}")  # Debug print
-            
-            if hasattr(self, 'data_loaded'):
-                if self.data_loaded:
-                    print(f"DEBUG: Data loaded successfully, updating GUI with {len(self.shipment_data)} shipments")  # Debug print
-                    
-                    # Data loaded successfully
-                    dpg.set_value("data_status", f"✓ Loaded {len(self.shipment_data)} shipments")
-                    self.update_status(f"Successfully loaded {len(self.shipment_data)} shipments", "success")
-                    self.refresh_table()
-                    self.update_selection_count()
-                    
-                    # Enable processing buttons
-                    dpg.configure_item("generate_selected_btn", enabled=True)
-                    dpg.configure_item("generate_all_btn", enabled=True)
-                    dpg.configure_item("select_all_btn", enabled=True)
-                    dpg.configure_item("deselect_all_btn", enabled=True)
-                    
-                    # Re-enable load button
-                    dpg.configure_item("load_data_btn", enabled=True, label="Load Data")
-                    
-                elif hasattr(self, 'load_error') and self.load_error:
-                    print(f"DEBUG: Data loading failed: {self.load_error}")  # Debug print
-                    
-                    # Data loading failed
-                    dpg.set_value("data_status", "Failed to load data")
-                    self.update_status(self.load_error, "error")
-                    dpg.configure_item("load_data_btn", enabled=True, label="Load Data")
-                    
-                else:
-                    print("DEBUG: Still loading, checking again...")  # Debug print
-                    # Still loading, check again
-                    threading.Timer(0.1, check).start()
-            else:
-                print("DEBUG: data_loaded attribute not found, checking again...")  # Debug print
-                # Still loading, check again
-                threading.Timer(0.1, check).start()
-        
-        # Start checking
-        threading.Timer(0.1, check).start()
-    
     def refresh_table(self):
         """Refresh the shipment table with current data"""
-        print(f"DEBUG refresh_table called with {len(self.filtered_data)} filtered shipments")
+        gui_logger.debug("refresh_table called with %d filtered shipments", len(self.filtered_data))
         if not dpg.does_item_exist("shipment_table"):
-            print("DEBUG: Table doesn't exist!")
+            gui_logger.debug("Table doesn't exist!")
             return
             
-        # Clear all existing rows (only data rows, not the header)
-        try:
-            table_children = dpg.get_item_children("shipment_table", slot=1)
-            if table_children:
-                print(f"DEBUG: Clearing {len(table_children)} existing table rows")
-                for child in table_children:
-                    dpg.delete_item(child)
-        except Exception as e:
-            print(f"DEBUG: Error clearing table: {e}")
-        
-        # Add data rows directly - no special master checkbox row
-        print(f"DEBUG: Adding {len(self.filtered_data)} data rows")
-        
-        # Data rows only
-        for i, shipment in enumerate(self.filtered_data):
-            # Find original index for selection callback
-            original_index = next((j for j, orig in enumerate(self.shipment_data) 
-                                 if orig['shipment_nbr'] == shipment['shipment_nbr']), i)
-            
-            with dpg.table_row(parent="shipment_table"):
-                with dpg.table_cell():
-                    dpg.add_checkbox(
-                        default_value=shipment['selected'],
-                        callback=self.toggle_shipment_selection,
-                        user_data=original_index,
-                        tag=f"checkbox_{i}"
-                    )
-                with dpg.table_cell():
-                    dpg.add_text(shipment['shipment_nbr'], color=[240, 240, 240])
-                with dpg.table_cell():
-                    dpg.add_text(shipment['do_numbers'][:50] + "..." if len(shipment['do_numbers']) > 50 else shipment['do_numbers'], color=[240, 240, 240])
-                with dpg.table_cell():
-                    dpg.add_text(str(shipment['do_count']), color=[240, 240, 240])
-                with dpg.table_cell():
-                    dpg.add_text(shipment['ship_to'][:25] + "..." if len(shipment['ship_to']) > 25 else shipment['ship_to'], color=[240, 240, 240])
-                with dpg.table_cell():
-                    dpg.add_text(shipment['po'][:25] + "..." if len(shipment['po']) > 25 else shipment['po'], color=[240, 240, 240])
-                with dpg.table_cell():
-                    dpg.add_text(shipment['vas'][:15] + "..." if len(shipment['vas']) > 15 else shipment['vas'], color=[240, 240, 240])
-                with dpg.table_cell():
-                    dpg.add_text(shipment['original_qty'], color=[34, 139, 34])
-                with dpg.table_cell():
-                    dpg.add_text(shipment['label_type'][:15] + "..." if len(shipment['label_type']) > 15 else shipment['label_type'], color=[240, 240, 240])
-                with dpg.table_cell():
-                    dpg.add_text(shipment['order_type'][:15] + "..." if len(shipment['order_type']) > 15 else shipment['order_type'], color=[240, 240, 240])
-                with dpg.table_cell():
-                    dpg.add_text(shipment['pmt_term'][:15] + "..." if len(shipment['pmt_term']) > 15 else shipment['pmt_term'], color=[240, 240, 240])
+        # Rows are created once and reused: each refresh rewrites the values
+        # of the first len(filtered_data) rows and hides the rest, instead of
+        # deleting and rebuilding every row and cell
+        gui_logger.debug("Updating %d data rows", len(self.filtered_data))
+        pool = self._table_rows
+        shown = self._table_rows_shown
+        with dpg.mutex():
+            for i, shipment in enumerate(self.filtered_data):
+                if i == len(pool):
+                    pool.append(self._add_table_row(i))
+                elif i >= shown:
+                    dpg.configure_item(pool[i].row, show=True)
+                row = pool[i]
+                
+                # Original index for the selection callback
+                dpg.configure_item(row.checkbox,
+                                   user_data=self._shipment_positions.get(shipment['shipment_nbr'], i))
+                dpg.set_value(row.checkbox, shipment['selected'])
+                for text, (key, limit, _) in zip(row.texts, _TABLE_TEXT_COLUMNS):
+                    value = str(shipment[key])
+                    dpg.set_value(text, value[:limit] + "..." if limit and len(value) > limit else value)
+            
+            for row in pool[len(self.filtered_data):shown]:
+                dpg.configure_item(row.row, show=False)
+        self._table_rows_shown = len(self.filtered_data)
+        
+        gui_logger.debug("Table refresh completed")
+    
+    def _add_table_row(self, position: int) -> _TableRow:
+        """Append an empty row to the shipment table for refresh_table to fill"""
+        with dpg.table_row(parent="shipment_table") as row:
+            with dpg.table_cell():
+                checkbox = dpg.add_checkbox(
+                    callback=self.toggle_shipment_selection,
+                    tag=f"checkbox_{position}"
+                )
+            texts = []
+            for _, _, color in _TABLE_TEXT_COLUMNS:
                 with dpg.table_cell():
-                    dpg.add_text(shipment['start_ship'][:15] + "..." if len(shipment['start_ship']) > 15 else shipment['start_ship'], color=[240, 240, 240])
-        
-        print("DEBUG: Table refresh completed")
+                    texts.append(dpg.add_text("", color=color))
+        return _TableRow(row, checkbox, texts)
     
     def update_individual_checkboxes(self):
         """Update individual row checkboxes to match their data state"""
-        print(f"DEBUG: update_individual_checkboxes called for {len(self.filtered_data)} shipments")
+        gui_logger.debug("update_individual_checkboxes called for %d shipments", len(self.filtered_data))
         updated_count = 0
         for i, shipment in enumerate(self.filtered_data):
             checkbox_tag = f"checkbox_{i}"
             if dpg.does_item_exist(checkbox_tag):
                 dpg.set_value(checkbox_tag, shipment['selected'])
                 updated_count += 1
-                print(f"DEBUG: Updated checkbox {checkbox_tag} to {shipment['selected']}")
             else:
-                print(f"DEBUG: Checkbox {checkbox_tag} does not exist!")
-        print(f"DEBUG: Updated {updated_count} checkboxes")
+                gui_logger.debug("Checkbox %s does not exist!", checkbox_tag)
+        gui_logger.debug("Updated %d checkboxes", updated_count)
     
     def toggle_shipment_selection(self, sender, app_data, user_data):
         """Toggle selection of a specific shipment"""
@@ -1292,7 +1314,7 @@ class PlacardGeneratorGUI:
     
     def select_all_callback(self, sender, app_data):
         """Select all visible (filtered) shipments"""
-        print(f"DEBUG: select_all_callback triggered with {len(self.filtered_data)} filtered shipments")
+        gui_logger.debug("select_all_callback triggered with %d filtered shipments", len(self.filtered_data))
         self.log_to_console(f"Selecting all {len(self.filtered_data)} visible shipments", "info")
         
         for shipment in self.filtered_data:
@@ -1311,7 +1333,7 @@ class PlacardGeneratorGUI:
     
     def deselect_all_callback(self, sender, app_data):
         """Deselect all visible (filtered) shipments"""
-        print(f"DEBUG: deselect_all_callback triggered with {len(self.filtered_data)} filtered shipments")
+        gui_logger.debug("deselect_all_callback triggered with %d filtered shipments", len(self.filtered_data))
         self.log_to_console(f"Deselecting all {len(self.filtered_data)} visible shipments", "info")
         
         for shipment in self.filtered_data:
@@ -1423,7 +1445,7 @@ class PlacardGeneratorGUI:
                 if InputValidator.validate_shipment_number(shipment):
                     validated_shipments.append(shipment)
                 else:
-                    security_logger.warning(f"Invalid shipment number filtered: {shipment}")
+                    security_logger.warning("Invalid shipment number filtered: %s", shipment)
             
             if not validated_shipments:
                 raise SecurityError("No valid shipment numbers provided")
@@ -1472,9 +1494,9 @@ class PlacardGeneratorGUI:
                         raise ValueError(f"Invalid shipment number format: {shipment_num}")
                     
                     # Process the shipment with timeout protection
-                    start_time = time.time()
+                    start_time = time.perf_counter()
                     if self.generator.process_shipment(shipment_num):
-                        processing_time = time.time() - start_time
+                        processing_time = time.perf_counter() - start_time
                         successful_count += 1
                         self.log_to_console(f"Successfully processed shipment {shipment_num} in {processing_time:.2f}s", "success")
                     else:
@@ -1488,7 +1510,7 @@ class PlacardGeneratorGUI:
                 except Exception as e:
                     failed_count += 1
                     failed_shipments.append(shipment_num)
-                    self.log_to_console(f"Error processing shipment {shipment_num}: {str(e)}", "error")
+                    self.log_to_console(f"Error processing shipment {shipment_num}: {str(e)}", "error", trusted=False)
                     continue
             
             # Update final status with detailed reporting
@@ -1507,19 +1529,19 @@ class PlacardGeneratorGUI:
                         self.log_to_console(f"... and {len(failed_shipments) - 10} more failed shipments", "error")
             
             # Log performance metrics
-            processing_rate = len(shipments) / max(1, time.time() - start_time) if 'start_time' in locals() else 0
+            processing_rate = len(shipments) / max(1, time.perf_counter() - start_time) if 'start_time' in locals() else 0
             self.log_to_console(f"Processing rate: {processing_rate:.2f} shipments/second", "info")
             
         except SecurityError as e:
-            self.update_status(f"❌ Security error during processing: {str(e)}", "error")
-            self.log_to_console(f"SECURITY ERROR in processing thread: {str(e)}", "error")
-            security_logger.error(f"Processing security violation: {e}")
+            self.update_status(f"❌ Security error during processing: {str(e)}", "error", trusted=False)
+            self.log_to_console(f"SECURITY ERROR in processing thread: {str(e)}", "error", trusted=False)
+            security_logger.error("Processing security violation: %s", e)
             
         except Exception as e:
-            self.update_status(f"❌ Critical error during processing: {str(e)}", "error")
-            self.log_to_console(f"CRITICAL ERROR in processing thread: {str(e)}", "error")
-            self.log_to_console(f"Stack trace: {traceback.format_exc()}", "error")
-            gui_logger.error(f"Processing thread failed: {e}", exc_info=True)
+            self.update_status(f"❌ Critical error during processing: {str(e)}", "error", trusted=False)
+            self.log_to_console(f"CRITICAL ERROR in processing thread: {str(e)}", "error", trusted=False)
+            self.log_to_console(f"Stack trace: {traceback.format_exc()}", "error", trusted=False)
+            gui_logger.error("Processing thread failed: %s", e, exc_info=True)
             
         finally:
             # Re-enable buttons and hide progress with safe operations
@@ -1706,7 +1728,7 @@ class PlacardGeneratorGUI:
                 with dpg.child_window(height=30, width=400, border=True, tag="status_inner", pos=[0, 5], no_scrollbar=True, no_scroll_with_mouse=True):
                     with dpg.group(horizontal=True):
                         dpg.add_spacer(width=1)  # Flexible spacer inside status window
-                        dpg.add_text("STATUS: Ready", tag="status_text", color=[70, 130, 200])
+                        self._status_text_id = dpg.add_text("STATUS: Ready", tag="status_text", color=[70, 130, 200])
                         self._safe_bind_font(dpg.last_item(), self.bold_font)
                         dpg.add_spacer(width=1)  # Flexible spacer inside status window
             
@@ -1730,8 +1752,9 @@ class PlacardGeneratorGUI:
             dpg.add_spacer(height=5)
             
             # Console window - full width
-            with dpg.child_window(height=150, border=True, tag="console_window"):
-                dpg.add_input_text(
+            with dpg.child_window(height=150, border=True, tag="console_window") as console_window:
+                self._console_window_id = console_window
+                self._console_text_id = dpg.add_input_text(
                     tag="console_text",
                     multiline=True,
                     readonly=True,
@@ -1813,7 +1836,7 @@ class PlacardGeneratorGUI:
             self.refresh_table()
             self.update_status("Sorted", "success")
         except Exception as e:
-            self.update_status(f"Sort error: {str(e)}", "error")
+            self.update_status(f"Sort error: {str(e)}", "error", trusted=False)
         
     def copy_selected_to_clipboard(self, sender, app_data):
         """Copy selected rows to clipboard"""
@@ -1857,7 +1880,7 @@ class PlacardGeneratorGUI:
             self.update_status(f"Copied {len(selected_data)} rows", "success")
                 
         except Exception as e:
-            self.update_status(f"Copy error: {str(e)}", "error")
+            self.update_status(f"Copy error: {str(e)}", "error", trusted=False)
     
     def export_to_excel(self, sender, app_data):
         """Export current view to Excel file"""
@@ -1895,7 +1918,7 @@ class PlacardGeneratorGUI:
             self.update_status(f"Exported {len(export_data)} rows to {filename}", "success")
             
         except Exception as e:
-            self.update_status(f"Export error: {str(e)}", "error")
+            self.update_status(f"Export error: {str(e)}", "error", trusted=False)
     
     def run(self):
         """Run the GUI application"""
@@ -1939,17 +1962,23 @@ class PlacardGeneratorGUI:
             self.log_to_console("Console logging enabled - all activities will be tracked here", "info")
             
             # Start main loop
-            dpg.start_dearpygui()
+            self._render_loop()
             
         except Exception as e:
             print(f"Error starting GUI: {e}")
             
         finally:
+            if self._search_timer is not None:
+                self._search_timer.cancel()
+            self._load_executor.shutdown(wait=False)
+            self.generator.close_log()
+            self._status_text_id = self._console_text_id = self._console_window_id = None
             dpg.destroy_context()
 
 
 def main():
     """Main entry point for the GUI application"""
+    configure_logging(setup_logging)
     try:
         app = PlacardGeneratorGUI()
         app.run()
@@ -14,7 +14,7 @@ from pathlib import Path
 from typing import Dict, Any, Optional
 from datetime import datetime
 
-from .config import LOGGING, DIRECTORIES
+from .config import LOGGING, DIRECTORIES, VALIDATION
 
 
 def setup_logging(log_level: Optional[str] = None, log_to_file: bool = True) -> None:
@@ -115,6 +115,28 @@ def get_package_data_dir() -> Path:
         return Path.cwd()
 
 
+def scan_directory(path: Path) -> Dict[str, os.DirEntry]:
+    """
+    List a directory once and index its entries by name
+    
+    DirEntry caches the file type reported by the directory listing, so
+    existence and is_file()/is_dir() questions about its contents are
+    answered without further syscalls.
+    
+    Args:
+        path: Directory to scan
+        
+    Returns:
+        Dictionary mapping entry names to DirEntry objects (empty if the
+        directory does not exist or cannot be read)
+    """
+    try:
+        with os.scandir(path) as entries:
+            return {entry.name: entry for entry in entries}
+    except OSError:
+        return {}
+
+
 def ensure_package_directories() -> Dict[str, Path]:
     """
     Ensure all required package directories exist
@@ -123,11 +145,14 @@ def ensure_package_directories() -> Dict[str, Path]:
         Dictionary mapping directory names to Path objects
     """
     base_dir = get_package_data_dir()
+    existing = scan_directory(base_dir)
     directories = {}
     
     for dir_key, dir_name in DIRECTORIES.items():
         dir_path = base_dir / dir_name
-        dir_path.mkdir(parents=True, exist_ok=True, mode=0o755)
+        entry = existing.get(dir_name)
+        if entry is None or not entry.is_dir():
+            dir_path.mkdir(parents=True, exist_ok=True, mode=0o755)
         directories[dir_key] = dir_path
     
     return directories
@@ -149,8 +174,6 @@ def get_template_path() -> Path:
 
 def get_default_template() -> Optional[Path]:
     """Get the path to the default template file"""
-    from .config import VALIDATION
-    
     template_dir = get_template_path()
     template_name = VALIDATION.get('TEMPLATE_FILENAME', 'placard_template.docx')
     template_path = template_dir / template_name
@@ -178,16 +201,32 @@ def validate_package_installation() -> Dict[str, Any]:
         directories = ensure_package_directories()
         results['directories'] = {k: str(v) for k, v in directories.items()}
         
-        # Check for template
-        template_path = get_default_template()
-        if template_path:
+        # Check for template using a single listing of the template directory
+        template_dir = get_template_path()
+        template_name = VALIDATION.get('TEMPLATE_FILENAME', 'placard_template.docx')
+        template_entry = scan_directory(template_dir).get(template_name)
+        if template_entry is not None and template_entry.is_file():
             results['template_found'] = True
-            results['template_path'] = str(template_path)
+            results['template_path'] = str(template_dir / template_name)
         else:
             results['warnings'].append(
-                f"Default template not found. Please place '{VALIDATION.get('TEMPLATE_FILENAME')}' "
-                f"in {get_template_path()}"
+                f"Default template not found. Please place '{template_name}' "
+                f"in {template_dir}"
+            )
+        
+        # Check for input data using a single listing of the data directory
+        data_folder = directories.get('DATA_FOLDER')
+        excel_prefix = VALIDATION.get('EXCEL_FILE_PREFIX', '')
+        if data_folder is not None:
+            has_excel = any(
+                name.startswith(excel_prefix) and name.lower().endswith(('.xlsx', '.xls'))
+                and entry.is_file()
+                for name, entry in scan_directory(data_folder).items()
             )
+            if not has_excel:
+                results['warnings'].append(
+                    f"No Excel file starting with '{excel_prefix}' found in {data_folder}"
+                )
         
         # Check write permissions
         data_dir = get_package_data_dir()
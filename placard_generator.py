@@ -13,20 +13,32 @@ Security Features:
 - Comprehensive error handling and logging
 """
 
+import io
+import atexit
 import os
 import sys
 import csv
+import copy
+import contextlib
 import re
+import signal
+import functools
 import logging
+import queue
 import threading
-from datetime import datetime, timedelta
-from typing import List, Dict, Optional, Tuple, Any, cast
+import time
+import zipfile
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from datetime import datetime
+from typing import List, Dict, FrozenSet, Mapping, Optional, Tuple, Any, Callable, Iterator, NamedTuple, TextIO, cast
 
+import numpy as np
 import pandas as pd
 from docx import Document
 from docx.shared import Inches
 from docx.oxml import parse_xml
-from docx.oxml.ns import nsdecls
+from docx.oxml.ns import nsdecls, qn
 
 # Import security utilities
 from security_utils import (
@@ -34,23 +46,229 @@ from security_utils import (
     SecurityError, RateLimiter, security_logger
 )
 
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.FileHandler('application.log'),
-        logging.StreamHandler()
-    ]
-)
+# The package's logging setup (LOGGING config, Logs folder). The standalone
+# placard_generator.py script has no package around it and falls back to
+# application.log; see configure_logging.
+try:
+    from .utils import setup_logging
+except ImportError:
+    setup_logging = None
+
 app_logger = logging.getLogger('placard_generator')
 
+# Arrow-backed columns keep string and numeric data contiguous, which speeds
+# up the vectorized filtering after load. pyarrow is optional, so fall back
+# to pandas' default NumPy dtypes when it is not installed.
+try:
+    import pyarrow  # noqa: F401
+    _READ_EXCEL_OPTIONS: Dict[str, Any] = {'dtype_backend': 'pyarrow'}
+except ImportError:
+    _READ_EXCEL_OPTIONS = {}
+
+# python-calamine parses workbooks in Rust, several times faster than
+# openpyxl's pure-Python XML reader. pandas only knows the engine from 2.2
+# on, so use it when both are there; the other engines stay as fallbacks
+# (xlrd only for legacy .xls files, which openpyxl cannot read).
+try:
+    import python_calamine  # noqa: F401
+    _HAS_CALAMINE = tuple(int(part) for part in pd.__version__.split('.')[:2]) >= (2, 2)
+except (ImportError, ValueError):
+    _HAS_CALAMINE = False
+_XLSX_ENGINES = ('calamine', 'openpyxl') if _HAS_CALAMINE else ('openpyxl',)
+_XLS_ENGINES = ('calamine', 'xlrd') if _HAS_CALAMINE else ('xlrd',)
+
+# Free-text columns are read straight into pandas' string dtype, skipping
+# per-cell type inference. Identifier, date and quantity columns are still
+# inferred, since later steps convert them numerically.
+_TEXT_COLUMN_DTYPES = {
+    column: 'string' for column in ('Label Type', 'Order Type', 'Pmt Term', 'VAS', 'Ship To', 'PO')
+}
+
+# Columns holding a few distinct values repeated across many rows. Once the
+# data is validated they are stored as categoricals, so grouping, unique()
+# and lookups work on small integer codes. DO # and PO are close to one value
+# per row and gain nothing from this.
+_CATEGORY_COLUMNS = ('Shipment Nbr', 'Label Type', 'Order Type', 'Pmt Term', 'VAS', 'Ship To')
+
+
+# Answers accepted as "yes" at the interactive prompts
+_YES_ANSWERS = frozenset(('y', 'yes'))
+# The return-to-menu prompt treats an empty answer as yes
+_CONTINUE_ANSWERS = _YES_ANSWERS | {''}
+
+
+# Each placard is an independent document and rendering is CPU-bound in
+# python-docx/lxml, so bulk runs fan it out over worker processes. The
+# parent only waits on results, so every core gets a worker. Only the cores
+# the process may run on count: its affinity mask, where the OS has one,
+# reflects taskset/cpuset limits that os.cpu_count() ignores.
+def _available_cpus() -> int:
+    try:
+        return len(os.sched_getaffinity(0)) or 1
+    except (AttributeError, OSError):  # No affinity API (Windows, macOS)
+        return os.cpu_count() or 1
+
+
+_MAX_RENDER_WORKERS = _available_cpus()
+
+
+class _PlacardJob(NamedTuple):
+    """A shipment whose placard data is ready to be rendered"""
+    shipment_num: str
+    records_found: int
+    do_count: int
+    output_filename: str
+    output_path: str
+    pages: List[Dict[str, str]]
+    start_time: float
+
+
+class _MenuResult(NamedTuple):
+    """Outcome of one main-menu action"""
+    successful: int
+    failed: int
+    exit: bool = False
+
+
+class PageData(NamedTuple):
+    """The values printed on one DO # page of a placard"""
+    do_num: int
+    ship_to: str
+    po: str
+    quantity: int
+    start_ship: str
+    vas: str
+    label_type: str
+    order_type: str
+    pmt_term: str
+    
+    def shipment_replacements(self, shipment_num: str) -> Dict[str, str]:
+        """Map the placeholders that are the same on every page of a shipment"""
+        return {
+            '{{Shipment Nbr}}': shipment_num,
+            '{{VAS}}': self.vas,
+            '{{Label Type}}': self.label_type,
+            '{{Order Type}}': self.order_type,
+            '{{Pmt Term}}': self.pmt_term,
+            '{{Start Ship}}': self.start_ship
+        }
+    
+    def page_replacements(self) -> Dict[str, str]:
+        """Map the placeholders specific to this DO # page"""
+        return {
+            '{{Ship To}}': self.ship_to,
+            '{{PO}}': self.po,
+            '{{DO #}}': f"{self.do_num:010d}",  # Format with leading zeros (10 digits)
+            '{{Original Qty}}': f"{self.quantity} Units"  # Add "Units" after quantity
+        }
+    
+    def replacements(self, shipment_num: str) -> Dict[str, str]:
+        """Map the template placeholders to this page's values"""
+        return {**self.shipment_replacements(shipment_num), **self.page_replacements()}
+
+
+@functools.lru_cache(maxsize=32)
+def _placeholder_pattern(placeholders: FrozenSet[str]) -> 're.Pattern[str]':
+    """Compile an alternation matching any of placeholders, once per set
+    
+    Every placard uses the same placeholders, so the pattern is built once
+    per run instead of once per document. Longer placeholders come first so
+    none is shadowed by a shorter one it starts with.
+    """
+    ordered = sorted(placeholders, key=lambda placeholder: (-len(placeholder), placeholder))
+    return re.compile('|'.join(map(re.escape, ordered)))
+
+
+def _group_rows(keys: pd.Series, weights: np.ndarray) -> Tuple[Any, np.ndarray, List[np.ndarray]]:
+    """Group rows by key in one pass: factorize, then bincount and a stable sort
+    
+    Returns:
+        Tuple of (sorted distinct keys, sum of weights per key, positions of
+        each key's rows in their original order). Rows with a null key are
+        left out.
+    """
+    codes, uniques = pd.factorize(keys, sort=True)
+    positions = np.arange(len(codes))
+    if (codes < 0).any():
+        present = codes >= 0
+        codes, weights, positions = codes[present], weights[present], positions[present]
+    
+    counts = np.bincount(codes, minlength=len(uniques))
+    totals = np.bincount(codes, weights=weights, minlength=len(uniques))
+    grouped = positions[np.argsort(codes, kind='stable')]
+    return uniques, totals, np.split(grouped, np.cumsum(counts)[:-1])
+
+
+# The CSV session log is written by a background thread (see log_event),
+# which flushes at most this many seconds after an event is queued
+_EVENT_LOG_FLUSH_INTERVAL = 1.0
+# Queued to tell the event log writer to stop
+_EVENT_LOG_STOP = object()
+# Longest log_event(flush=True) waits for its event to reach the disk
+_EVENT_LOG_SYNC_TIMEOUT = 5.0
+# A session that produced nothing and ended within this many seconds does not
+# wait for its SESSION_END event to be fsynced
+_QUICK_SESSION_SECONDS = 1.0
+# Status of the batch summary events, filled lazily by log_event
+_COMPLETED_STATUS = "COMPLETED: %d success, %d failed"
+
+
+# Background thread writing queued log records; see configure_logging
+_log_listener: Optional[QueueListener] = None
+
+
+def configure_logging(setup: Optional[Callable[[], None]] = None) -> None:
+    """Configure default logging unless the caller has already set it up
+    
+    The handlers come from setup (the package's setup_logging by default),
+    or are a rotating application.log plus the console when there is none.
+    Either way they run on a listener thread behind a queue.
+    """
+    global _log_listener
+    
+    # Leave an existing setup alone, so a CLI-level setup_logging() call
+    # always takes precedence.
+    root_logger = logging.getLogger()
+    if root_logger.handlers:
+        return
+    
+    setup = setup or setup_logging
+    if setup is not None:
+        setup()
+        handlers = list(root_logger.handlers)
+    else:
+        formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+        handlers = [
+            RotatingFileHandler('application.log', maxBytes=10 * 1024 * 1024, backupCount=5),
+            logging.StreamHandler()
+        ]
+        for handler in handlers:
+            handler.setFormatter(formatter)
+        root_logger.setLevel(logging.INFO)
+    
+    # Records are only queued on the calling thread; the listener thread does
+    # the file and console I/O, keeping each handler's own level
+    log_queue: 'queue.SimpleQueue[logging.LogRecord]' = queue.SimpleQueue()
+    _log_listener = QueueListener(log_queue, *handlers, respect_handler_level=True)
+    _log_listener.start()
+    atexit.register(_log_listener.stop)
+    
+    # The queue handler only merges message arguments and tracebacks into the
+    # record; the listener's handlers apply the real format
+    queue_handler = QueueHandler(log_queue)
+    queue_handler.setFormatter(logging.Formatter('%(message)s'))
+    root_logger.handlers = [queue_handler]
+
 
 class PlacardGenerator:
     """High-performance logistics document generator with comprehensive security"""
     
     def __init__(self):
+        configure_logging()
+        
         self.df: Optional[pd.DataFrame] = None
+        # Shipment number -> row positions in self.df, rebuilt on each load
+        self._shipment_index: Dict[str, Any] = {}
         self.required_columns = [
             'Shipment Nbr', 'DO #', 'Label Type', 'Order Type', 
             'Pmt Term', 'Start Ship', 'VAS', 'Ship To', 'PO', 'Original Qty'
@@ -59,7 +277,34 @@ class PlacardGenerator:
         self.template_folder = "Template"
         self.output_folder = "Placards"
         self.log_folder = "Logs"
+        self.template_path = os.path.join(self.template_folder, "placard_template.docx")
         self.log_file = None
+        self._log_queue: Optional['queue.SimpleQueue[Any]'] = None
+        self._log_thread: Optional[threading.Thread] = None
+        self._log_lock = threading.Lock()
+        self._session_id = datetime.now().strftime("%Y%m%d_%H%M%S")
+        # (epoch second, console timestamp prefix) last formatted
+        self._timestamp_cache: Tuple[int, str] = (-1, "")
+        # Print per-DO progress lines; switch off for quiet bulk runs
+        self.verbose = True
+        # CSV log events below this level are dropped; DEBUG adds a
+        # SHIPMENT_PROCESS record for every successful bulk placard
+        self.event_log_level = logging.INFO
+        # Copy page content run by run (python-docx API) instead of as XML
+        self.legacy_content_copy = False
+        
+        # Raw template file, read once and parsed from memory for every page
+        self._template_bytes: Optional[bytes] = None
+        self._template_source: Optional[str] = None
+        self._template_mtime: Optional[float] = None
+        self._compiled_template: Optional[CompiledTemplate] = None
+        
+        # Main menu choices -> the action each one runs
+        self._menu: Dict[str, Callable[[], _MenuResult]] = {
+            '1': self._run_manual_entry,
+            '2': self._run_bulk,
+            '3': self._run_exit,
+        }
         
         # Security components
         self.data_handler = SecureFileHandler(self.data_folder)
@@ -72,17 +317,97 @@ class PlacardGenerator:
         self._processing_lock = threading.Lock()
         self._is_processing = False
         
+        # Set by the SIGINT handler while a batch is running; the batch stops
+        # at the next shipment boundary instead of being torn down mid-write
+        self._interrupted = False
+        self._defer_interrupts = False
+        
+        # Piped (non-interactive) stdin is read line by line without input()
+        self._stdin_is_tty = sys.stdin is not None and sys.stdin.isatty()
+        
         # Performance monitoring
         self._start_time = None
         self._processed_count = 0
         
-    def get_timestamp(self) -> str:
-        """Get a readable timestamp for console output"""
-        return datetime.now().strftime("[%Y-%m-%d %H:%M:%S]")
+    def _handle_sigint(self, signum: int, frame: Any) -> None:
+        """SIGINT handler: defer the first Ctrl+C during a batch, otherwise interrupt"""
+        if self._defer_interrupts and not self._interrupted:
+            self._interrupted = True
+            return
+        raise KeyboardInterrupt
+    
+    @contextlib.contextmanager
+    def _interrupts_deferred(self) -> Iterator[None]:
+        """Turn Ctrl+C into a stop request for the duration of a batch
+        
+        Installs _handle_sigint itself (main thread only) so that callers
+        other than run(), such as the CLI's --all and -s paths, get it too.
+        """
+        if self._defer_interrupts:
+            yield
+            return
+        
+        self._interrupted = False
+        previous_sigint = None
+        if (threading.current_thread() is threading.main_thread()
+                and signal.getsignal(signal.SIGINT) != self._handle_sigint):
+            previous_sigint = signal.signal(signal.SIGINT, self._handle_sigint)
+        
+        self._defer_interrupts = True
+        try:
+            yield
+        finally:
+            self._defer_interrupts = False
+            if previous_sigint is not None:
+                signal.signal(signal.SIGINT, previous_sigint)
+    
+    def _prompt(self, message: str) -> str:
+        """Show message and read one line of user input (without the newline)
+        
+        Interactive sessions go through input() for line editing; piped
+        input is read straight from the buffered stdin. Raises EOFError
+        when the input is exhausted, as input() does.
+        """
+        if self._stdin_is_tty:
+            return input(message)
+        sys.stdout.write(message)
+        sys.stdout.flush()
+        line = sys.stdin.readline()
+        if not line:
+            raise EOFError
+        return line.rstrip('\r\n')
+    
+    def get_timestamp(self, now: Optional[datetime] = None) -> str:
+        """Get a readable timestamp for console output
+        
+        The timestamp only has second resolution, so the current one is
+        formatted once per second and reused by every print in between.
+        """
+        if now is not None:
+            return self._format_timestamp(now.timetuple())
+        
+        second = int(time.time())
+        cached_second, prefix = self._timestamp_cache
+        if second != cached_second:
+            prefix = self._format_timestamp(time.localtime(second))
+            self._timestamp_cache = (second, prefix)
+        return prefix
     
-    def print_with_timestamp(self, message: str) -> None:
-        """Print message with timestamp prefix"""
-        print(f"{self.get_timestamp()} {message}")
+    @staticmethod
+    def _format_timestamp(t: time.struct_time) -> str:
+        # Plain integer formatting avoids strftime's locale-aware parsing
+        return (f"[{t.tm_year:04d}-{t.tm_mon:02d}-{t.tm_mday:02d} "
+                f"{t.tm_hour:02d}:{t.tm_min:02d}:{t.tm_sec:02d}]")
+    
+    def print_with_timestamp(self, message: str, ts: Optional[datetime] = None) -> None:
+        """Print message with timestamp prefix (ts defaults to now)"""
+        print(f"{self.get_timestamp(ts)} {message}")
+    
+    def print_block_with_timestamp(self, messages: List[str], ts: Optional[datetime] = None) -> None:
+        """Print several timestamped lines with a single write to stdout"""
+        timestamp = self.get_timestamp(ts)
+        sys.stdout.write(''.join([f"{timestamp} {message}\n" for message in messages]))
+        sys.stdout.flush()
         
     def setup_directories(self) -> bool:
         """Ensure required directories exist"""
@@ -103,22 +428,37 @@ class PlacardGenerator:
             timestamp = datetime.now().strftime("%Y-%m-%d_%H-%M-%S")
             self.log_file = os.path.join(self.log_folder, f"{timestamp}-placard_processing_log.csv")
             
+            # Keep one buffered handle open for the whole session instead of
+            # reopening the file for every event
+            self.close_log()
+            log_handle = open(self.log_file, 'w', newline='', encoding='utf-8', buffering=1 << 16)
+            writer = csv.writer(log_handle)
+            
             # Create CSV with headers
-            with open(self.log_file, 'w', newline='', encoding='utf-8') as csvfile:
-                writer = csv.writer(csvfile)
-                writer.writerow([
-                    'Timestamp',
-                    'Session_ID',
-                    'Event_Type',
-                    'Shipment_Number',
-                    'DO_Count',
-                    'Records_Found',
-                    'Status',
-                    'Output_File',
-                    'Error_Message',
-                    'Processing_Mode',
-                    'Duration_Seconds'
-                ])
+            writer.writerow([
+                'Timestamp',
+                'Session_ID',
+                'Event_Type',
+                'Shipment_Number',
+                'DO_Count',
+                'Records_Found',
+                'Status',
+                'Output_File',
+                'Error_Message',
+                'Processing_Mode',
+                'Duration_Seconds'
+            ])
+            
+            # Events are queued by log_event and written off the caller's thread
+            log_queue: 'queue.SimpleQueue[Any]' = queue.SimpleQueue()
+            log_thread = threading.Thread(
+                target=self._log_worker, args=(log_queue, log_handle, writer),
+                name="placard-event-log", daemon=True
+            )
+            log_thread.start()
+            with self._log_lock:
+                self._log_queue = log_queue
+                self._log_thread = log_thread
             
             self.print_with_timestamp(f"Logging to: {self.log_file}")
             return True
@@ -131,43 +471,118 @@ class PlacardGenerator:
                   do_count: Optional[int] = None, records_found: Optional[int] = None,
                   status: str = "SUCCESS", output_file: Optional[str] = None,
                   error_message: Optional[str] = None, processing_mode: Optional[str] = None,
-                  duration: Optional[float] = None) -> None:
-        """Log an event to the CSV file"""
-        if not self.log_file:
+                  duration: Optional[float] = None, flush: bool = False,
+                  ts: Optional[datetime] = None, level: int = logging.INFO,
+                  args: Tuple[Any, ...] = ()) -> None:
+        """Queue an event for the CSV log file
+        
+        Events are buffered and written in the background. With flush=True
+        (session errors and endings) the call waits until the event has been
+        flushed and fsynced, so it survives a crash right after. ts lets a
+        caller stamp the event with a time it already read for its console
+        output.
+        
+        Events below event_log_level are dropped before anything is built.
+        As with logging, status may be a %-format filled from args, which
+        is only done for events that are kept.
+        """
+        log_queue = self._log_queue
+        if log_queue is None or level < self.event_log_level:
             return
             
         try:
-            with open(self.log_file, 'a', newline='', encoding='utf-8') as csvfile:
-                writer = csv.writer(csvfile)
-                writer.writerow([
-                    datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
-                    datetime.now().strftime("%Y%m%d_%H%M%S"),  # Session ID based on startup time
-                    event_type,
-                    shipment_number or "",
-                    do_count or "",
-                    records_found or "",
-                    status,
-                    output_file or "",
-                    error_message or "",
-                    processing_mode or "",
-                    f"{duration:.2f}" if duration else ""
-                ])
+            if args:
+                status = status % args
+            timestamp = (ts or datetime.now()).isoformat(' ', 'seconds')
+            synced = threading.Event() if flush else None
+            log_queue.put(([
+                timestamp,
+                self._session_id,  # Session ID based on startup time
+                event_type,
+                shipment_number or "",
+                do_count or "",
+                records_found or "",
+                status,
+                output_file or "",
+                error_message or "",
+                processing_mode or "",
+                f"{duration:.2f}" if duration else ""
+            ], synced))
+            if synced is not None:
+                synced.wait(_EVENT_LOG_SYNC_TIMEOUT)
+        except Exception as e:
+            self.print_with_timestamp(f"Warning: Could not write to log file: {e}")
+    
+    def _log_worker(self, log_queue: 'queue.SimpleQueue[Any]', log_handle: TextIO, writer: Any) -> None:
+        """Write queued events until told to stop, then close the log file
+        
+        Events are written into the handle's buffer as they arrive, and the
+        file is flushed at most _EVENT_LOG_FLUSH_INTERVAL seconds after an
+        event is written, so a burst of events costs one flush, not one each.
+        """
+        last_flush = time.monotonic()
+        unflushed = False
+        try:
+            while True:
+                timeout = None
+                if unflushed:
+                    timeout = max(0.0, last_flush + _EVENT_LOG_FLUSH_INTERVAL - time.monotonic())
+                try:
+                    item = log_queue.get(timeout=timeout)
+                except queue.Empty:
+                    item = None
+                
+                if item is _EVENT_LOG_STOP:
+                    break
+                if item is not None:
+                    row, synced = item
+                    try:
+                        writer.writerow(row)
+                        unflushed = True
+                        if synced is not None:
+                            log_handle.flush()
+                            os.fsync(log_handle.fileno())
+                            last_flush = time.monotonic()
+                            unflushed = False
+                    finally:
+                        if synced is not None:
+                            synced.set()
+                
+                if unflushed and time.monotonic() - last_flush >= _EVENT_LOG_FLUSH_INTERVAL:
+                    log_handle.flush()
+                    last_flush = time.monotonic()
+                    unflushed = False
         except Exception as e:
             self.print_with_timestamp(f"Warning: Could not write to log file: {e}")
+        finally:
+            try:
+                log_handle.close()
+            except Exception as e:
+                self.print_with_timestamp(f"Warning: Could not close log file: {e}")
+    
+    def close_log(self) -> None:
+        """Write out any queued events and close the CSV log file"""
+        with self._log_lock:
+            log_queue = self._log_queue
+            log_thread = self._log_thread
+            self._log_queue = None
+            self._log_thread = None
+        
+        if log_queue is not None and log_thread is not None:
+            log_queue.put(_EVENT_LOG_STOP)
+            log_thread.join()
     
     def find_excel_file(self) -> Optional[str]:
         """Find Excel file starting with 'WM-SPN-CUS105 Open Order Report' in Data folder"""
         try:
-            # Securely list files in data directory
-            xlsx_files = self.data_handler.safe_list_files("WM-SPN-CUS105 Open Order Report*.xlsx")
-            xls_files = self.data_handler.safe_list_files("WM-SPN-CUS105 Open Order Report*.xls")
-            
-            all_files = xlsx_files + xls_files
+            # Securely list files in data directory, .xlsx ahead of .xls
+            all_files = self.data_handler.scan_prefix("WM-SPN-CUS105 Open Order Report", ('.xlsx', '.xls'))
+            all_files.sort(key=lambda file_path: not file_path.lower().endswith('.xlsx'))
             
             if not all_files:
                 error_msg = f"ERROR: No Excel file found in '{self.data_folder}' folder starting with 'WM-SPN-CUS105 Open Order Report'"
                 self.print_with_timestamp(error_msg)
-                security_logger.warning(f"Excel file not found in {self.data_folder}")
+                security_logger.warning("Excel file not found in %s", self.data_folder)
                 return None
             
             # Additional security validation
@@ -175,19 +590,14 @@ class PlacardGenerator:
             for file_path in all_files:
                 # Validate file extension
                 if not SecurityConfig.validate_file_extension(file_path, SecurityConfig.ALLOWED_EXCEL_EXTENSIONS):
-                    security_logger.warning(f"Invalid file extension: {file_path}")
+                    security_logger.warning("Invalid file extension: %s", file_path)
                     continue
                     
                 # Validate file size
                 if not SecurityConfig.validate_file_size(file_path, SecurityConfig.MAX_EXCEL_FILE_SIZE):
-                    security_logger.warning(f"File too large: {file_path}")
+                    security_logger.warning("File too large: %s", file_path)
                     continue
                     
-                # Calculate and log file hash for integrity
-                file_hash = self.data_handler.calculate_file_hash(file_path)
-                if file_hash:
-                    app_logger.info(f"Processing file: {file_path} (SHA256: {file_hash[:16]}...)")
-                    
                 valid_files.append(file_path)
             
             if not valid_files:
@@ -196,25 +606,36 @@ class PlacardGenerator:
             
             if len(valid_files) > 1:
                 self.print_with_timestamp(f"Multiple Excel files found. Using: {valid_files[0]}")
-                security_logger.info(f"Multiple files available, selected: {valid_files[0]}")
+                security_logger.info("Multiple files available, selected: %s", valid_files[0])
+            
+            # Hash only the selected file, in the background, so logging its
+            # checksum doesn't read the whole workbook before loading starts
+            threading.Thread(target=self._log_file_hash, args=(valid_files[0],),
+                             name="file-hash", daemon=True).start()
             
             return valid_files[0]
             
         except SecurityError as e:
-            security_logger.error(f"Security error in file discovery: {e}")
+            security_logger.error("Security error in file discovery: %s", e)
             self.print_with_timestamp(f"Security error: {e}")
             return None
         except Exception as e:
-            app_logger.error(f"Unexpected error in file discovery: {e}")
+            app_logger.error("Unexpected error in file discovery: %s", e)
             self.print_with_timestamp(f"Unexpected error: {e}")
             return None
     
+    def _log_file_hash(self, file_path: str) -> None:
+        """Calculate and log the file hash for integrity"""
+        file_hash = self.data_handler.calculate_file_hash(file_path)
+        if file_hash:
+            app_logger.info("Processing file: %s (SHA256: %s...)", file_path, file_hash[:16])
+    
     def validate_do_number(self, do_num: Any) -> bool:
         """Validate DO # format using secure validation"""
         try:
             return InputValidator.validate_do_number(do_num)
         except Exception as e:
-            security_logger.error(f"DO number validation error: {e}")
+            security_logger.error("DO number validation error: %s", e)
             return False
     
     def validate_shipment_number(self, shipment_num: Any) -> bool:
@@ -222,53 +643,84 @@ class PlacardGenerator:
         try:
             return InputValidator.validate_shipment_number(shipment_num)
         except Exception as e:
-            security_logger.error(f"Shipment number validation error: {e}")
+            security_logger.error("Shipment number validation error: %s", e)
             return False
     
-    def validate_data_integrity(self, df: pd.DataFrame) -> bool:
-        """Comprehensive data validation with security checks"""
+    def validate_data_integrity(self, df: pd.DataFrame) -> Tuple[bool, pd.Series, Dict[str, int]]:
+        """
+        Comprehensive data validation with security checks
+        
+        Returns:
+            Tuple of (is_valid, valid_rows, filter_stats). valid_rows masks the
+            rows usable for processing (shipment number present, valid DO # and
+            shipment number) and filter_stats counts the rows removed by each
+            of those filters, applied in that order.
+        """
+        valid_rows = pd.Series(False, index=df.index)
+        filter_stats = {'empty_removed': 0, 'invalid_do_removed': 0, 'invalid_shipment_removed': 0}
+        
         try:
             validation_errors = []
             
             # Check required columns
-            missing_columns = [col for col in self.required_columns if col not in df.columns]
+            missing = set(self.required_columns).difference(df.columns)
+            missing_columns = [col for col in self.required_columns if col in missing]
             if missing_columns:
                 validation_errors.append(f"Missing required columns: {missing_columns}")
             
-            # Validate data types and content
-            for index, row in df.iterrows():
-                # Validate shipment number
-                if not self.validate_shipment_number(row.get('Shipment Nbr')):
-                    validation_errors.append(f"Invalid shipment number at row {index}")
+            # Validate data types and content one column at a time
+            text_field = functools.partial(InputValidator.validate_text_fields, max_length=500)
+            column_checks = [
+                ('Shipment Nbr', 'shipment number', InputValidator.validate_shipment_numbers),
+                ('DO #', 'DO number', InputValidator.validate_do_numbers),
+                ('Ship To', 'Ship To', text_field),
+                ('PO', 'PO', text_field),
+                ('Label Type', 'Label Type', text_field),
+                ('Order Type', 'Order Type', text_field),
+                ('Pmt Term', 'Pmt Term', text_field),
+                ('Original Qty', 'quantity', InputValidator.validate_numeric_fields),
+            ]
+            
+            column_masks = {}
+            for column, label, validator in column_checks:
+                if column in missing:
+                    continue
+                valid = validator(df[column]).to_numpy(dtype=bool)
+                column_masks[column] = valid
+                for index in df.index[~valid]:
+                    validation_errors.append(f"Invalid {label} at row {index}")
+            
+            # Derive the processing filters from the same masks, so loading
+            # doesn't walk the data again
+            if not missing:
+                shipments = df['Shipment Nbr']
+                keep = (shipments.notna() & (shipments.astype(str).str.strip() != '')).to_numpy(dtype=bool)
+                filter_stats['empty_removed'] = int((~keep).sum())
                 
-                # Validate DO number
-                if not self.validate_do_number(row.get('DO #')):
-                    validation_errors.append(f"Invalid DO number at row {index}")
+                do_valid = column_masks['DO #']
+                filter_stats['invalid_do_removed'] = int((keep & ~do_valid).sum())
+                keep = keep & do_valid
                 
-                # Validate text fields
-                text_fields = ['Ship To', 'PO', 'Label Type', 'Order Type', 'Pmt Term']
-                for field in text_fields:
-                    if not InputValidator.validate_text_field(row.get(field), max_length=500):
-                        validation_errors.append(f"Invalid {field} at row {index}")
+                shipment_valid = column_masks['Shipment Nbr']
+                filter_stats['invalid_shipment_removed'] = int((keep & ~shipment_valid).sum())
+                keep = keep & shipment_valid
                 
-                # Validate numeric fields
-                if not InputValidator.validate_numeric_field(row.get('Original Qty')):
-                    validation_errors.append(f"Invalid quantity at row {index}")
+                valid_rows = pd.Series(keep, index=df.index)
             
             # Log validation results
             if validation_errors:
                 for error in validation_errors[:10]:  # Log first 10 errors
-                    security_logger.warning(f"Data validation error: {error}")
+                    security_logger.warning("Data validation error: %s", error)
                 if len(validation_errors) > 10:
-                    security_logger.warning(f"... and {len(validation_errors) - 10} more validation errors")
-                return False
+                    security_logger.warning("... and %s more validation errors", len(validation_errors) - 10)
+                return False, valid_rows, filter_stats
             
-            app_logger.info(f"Data validation passed for {len(df)} records")
-            return True
+            app_logger.info("Data validation passed for %s records", len(df))
+            return True, valid_rows, filter_stats
             
         except Exception as e:
-            security_logger.error(f"Data validation failed with exception: {e}")
-            return False
+            security_logger.error("Data validation failed with exception: %s", e)
+            return False, valid_rows, filter_stats
     
     def load_and_prepare_data(self) -> bool:
         """Load Excel file and prepare data with comprehensive security validation"""
@@ -278,10 +730,10 @@ class PlacardGenerator:
                 return False
             self._is_processing = True
         
+        start_time = time.perf_counter()
+        self._start_time = start_time
         try:
             self.print_with_timestamp("Loading and preparing data...")
-            start_time = datetime.now()
-            self._start_time = start_time
             
             # Rate limiting check
             if not self.rate_limiter.allow_operation():
@@ -301,24 +753,37 @@ class PlacardGenerator:
             if not self.data_handler.safe_file_exists(excel_file):
                 error_msg = "Excel file validation failed"
                 self.print_with_timestamp(f"ERROR: {error_msg}")
-                security_logger.error(f"File validation failed: {excel_file}")
+                security_logger.error("File validation failed: %s", excel_file)
                 self.log_event("DATA_LOAD", status="FAILED", error_message=error_msg)
                 return False
                 
+            # Only materialize the columns the generator uses; a callable keeps
+            # missing columns from failing the read so validation reports them
+            required = set(self.required_columns)
+            read_options = dict(
+                _READ_EXCEL_OPTIONS,
+                usecols=lambda column: column in required,
+                dtype=_TEXT_COLUMN_DTYPES
+            )
+            
             # Load Excel file with error handling
             self.print_with_timestamp(f"Loading file: {excel_file}")
-            try:
-                df = pd.read_excel(excel_file, engine='openpyxl')
-            except Exception as read_error:
-                # Try with xlrd engine for .xls files
+            engines = _XLS_ENGINES if excel_file.lower().endswith('.xls') else _XLSX_ENGINES
+            df = None
+            read_error: Optional[Exception] = None
+            for engine in engines:
                 try:
-                    df = pd.read_excel(excel_file, engine='xlrd')
-                except Exception:
-                    error_msg = f"Failed to read Excel file with both engines: {read_error}"
-                    self.print_with_timestamp(f"ERROR: {error_msg}")
-                    security_logger.error(f"Excel read error: {read_error}")
-                    self.log_event("DATA_LOAD", status="FAILED", error_message=str(read_error))
-                    return False
+                    df = pd.read_excel(excel_file, engine=engine, **read_options)
+                    break
+                except Exception as e:
+                    # Report the preferred engine's error if every engine fails
+                    read_error = read_error or e
+            if df is None:
+                error_msg = f"Failed to read Excel file with {', '.join(engines)}: {read_error}"
+                self.print_with_timestamp(f"ERROR: {error_msg}")
+                security_logger.error("Excel read error: %s", read_error)
+                self.log_event("DATA_LOAD", status="FAILED", error_message=str(read_error))
+                return False
             
             initial_count = len(df)
             self.print_with_timestamp(f"Loaded {initial_count} rows from Excel file")
@@ -327,49 +792,52 @@ class PlacardGenerator:
             if initial_count > SecurityConfig.MAX_RECORDS_PER_BATCH:
                 error_msg = f"Dataset too large ({initial_count} records). Maximum allowed: {SecurityConfig.MAX_RECORDS_PER_BATCH}"
                 self.print_with_timestamp(f"ERROR: {error_msg}")
-                security_logger.warning(f"Large dataset detected: {initial_count} records")
+                security_logger.warning("Large dataset detected: %s records", initial_count)
                 self.log_event("DATA_LOAD", status="FAILED", error_message=error_msg)
                 return False
             
             # Comprehensive data validation
-            if not self.validate_data_integrity(df):
+            is_valid, valid_rows, filter_stats = self.validate_data_integrity(df)
+            if not is_valid:
                 error_msg = "Data integrity validation failed"
                 self.print_with_timestamp(f"ERROR: {error_msg}")
                 self.log_event("DATA_LOAD", status="FAILED", error_message=error_msg)
                 return False
             
-            # Filter out rows with empty Shipment Nbr
-            df = df[df['Shipment Nbr'].notna()]
-            shipment_series = cast(pd.Series, df['Shipment Nbr'].astype(str))
-            df = df[shipment_series.str.strip() != '']
-            empty_removed = initial_count - len(df)
-            
-            # Validate DO # format using secure validation
-            before_do_filter = len(df)
-            do_series = cast(pd.Series, df['DO #'])
-            df = df[do_series.apply(self.validate_do_number)]
-            invalid_do_removed = before_do_filter - len(df)
+            # Drop rows with empty Shipment Nbr or invalid DO #/shipment numbers
+            df = df.loc[valid_rows]
+            empty_removed = filter_stats['empty_removed']
+            invalid_do_removed = filter_stats['invalid_do_removed']
+            invalid_shipment_removed = filter_stats['invalid_shipment_removed']
             
-            # Validate shipment numbers
-            before_shipment_filter = len(df)
-            shipment_series = cast(pd.Series, df['Shipment Nbr'])
-            df = df[shipment_series.apply(self.validate_shipment_number)]
-            invalid_shipment_removed = before_shipment_filter - len(df)
+            # Format ship dates and VAS flags for the whole column up front so
+            # placards read ready strings instead of converting per shipment.
+            # Validated identifiers are whole numbers, but Excel hands them
+            # over as floats (or text); store them as integers once.
+            df = df.assign(**{
+                'Shipment Nbr': pd.to_numeric(df['Shipment Nbr']).astype('Int64'),
+                'DO #': pd.to_numeric(df['DO #']).astype('Int64'),
+                '_Start Ship Fmt': self.format_dates(df['Start Ship']),
+                '_VAS': self.get_vas_values(df['VAS'])
+            }).astype({column: 'category' for column in _CATEGORY_COLUMNS})
             
             # Assign to instance variable
             self.df = cast(pd.DataFrame, df)
+            self._index_shipments(self.df)
             
             # Calculate processing time
-            duration = (datetime.now() - start_time).total_seconds()
+            duration = time.perf_counter() - start_time
             
             if self.df is not None:
                 final_count = len(self.df)
-                self.print_with_timestamp(f"Data preparation summary:")
-                self.print_with_timestamp(f"  - Initial records: {initial_count}")
-                self.print_with_timestamp(f"  - Removed empty: {empty_removed}")
-                self.print_with_timestamp(f"  - Removed invalid DO#: {invalid_do_removed}")
-                self.print_with_timestamp(f"  - Removed invalid shipments: {invalid_shipment_removed}")
-                self.print_with_timestamp(f"  - Final dataset: {final_count} rows ready for processing")
+                self.print_block_with_timestamp([
+                    "Data preparation summary:",
+                    f"  - Initial records: {initial_count}",
+                    f"  - Removed empty: {empty_removed}",
+                    f"  - Removed invalid DO#: {invalid_do_removed}",
+                    f"  - Removed invalid shipments: {invalid_shipment_removed}",
+                    f"  - Final dataset: {final_count} rows ready for processing"
+                ])
                 
                 # Log successful data load
                 self.log_event(
@@ -380,14 +848,14 @@ class PlacardGenerator:
                     duration=duration
                 )
                 
-                app_logger.info(f"Data loaded successfully: {final_count} valid records")
+                app_logger.info("Data loaded successfully: %s valid records", final_count)
             return True
             
         except Exception as e:
-            duration = (datetime.now() - start_time).total_seconds() if start_time else 0
+            duration = time.perf_counter() - start_time
             error_msg = f"ERROR loading Excel file: {e}"
             self.print_with_timestamp(error_msg)
-            app_logger.error(f"Data loading failed: {e}", exc_info=True)
+            app_logger.error("Data loading failed: %s", e, exc_info=True)
             self.log_event("DATA_LOAD", status="FAILED", error_message=str(e), duration=duration)
             return False
             
@@ -410,6 +878,15 @@ class PlacardGenerator:
         except:
             return str(date_value)
     
+    def format_dates(self, date_values: pd.Series) -> pd.Series:
+        """Vectorized format_date for a whole column"""
+        def convert(dates: pd.Series) -> pd.Series:
+            formatted = pd.to_datetime(dates, errors='coerce', format='mixed').dt.strftime("%m/%d/%Y")
+            # Like format_date, unparseable values pass through as text
+            return formatted.fillna(dates.astype(str))
+        
+        return self._map_distinct(date_values, convert, "")
+    
     def get_vas_value(self, vas_raw: Any) -> str:
         """Convert VAS value to 'VAS' or 'NOT VAS'"""
         if pd.isna(vas_raw):
@@ -417,436 +894,388 @@ class PlacardGenerator:
         vas_str = str(vas_raw).strip().upper()
         return "VAS" if vas_str == "Y" else "NOT VAS"
     
+    def get_vas_values(self, vas_values: pd.Series) -> pd.Series:
+        """Vectorized get_vas_value for a whole column"""
+        def convert(flags: pd.Series) -> pd.Series:
+            return flags.astype(str).str.strip().str.upper().map({'Y': 'VAS'}).fillna('NOT VAS')
+        
+        return self._map_distinct(vas_values, convert, "NOT VAS")
+    
+    @staticmethod
+    def _map_distinct(values: pd.Series, convert: Any, missing: str) -> pd.Series:
+        """Apply a column conversion to each distinct value once
+        
+        Ship dates and VAS flags repeat across most rows of a report, so
+        converting the distinct values and broadcasting them back by code
+        avoids parsing the same value thousands of times.
+        
+        Args:
+            values: Column to convert
+            convert: Function mapping a Series of distinct non-null values
+                to a Series of strings
+            missing: Result for null values
+        """
+        codes, uniques = pd.factorize(values)
+        # Null values get code -1, which picks the appended missing entry
+        lookup = np.append(convert(pd.Series(uniques)).to_numpy(dtype=object), missing)
+        return pd.Series(lookup[codes], index=values.index, dtype='str')
+    
     def replace_placeholders_in_document(self, doc: Any, replacements: Dict[str, str]) -> None:
         """Replace all placeholders in the document while preserving formatting"""
-        
-        # Replace in paragraphs
-        for paragraph in doc.paragraphs:
-            for placeholder, value in replacements.items():
-                if placeholder in paragraph.text:
-                    self.replace_placeholder_in_paragraph(paragraph, placeholder, value)
-        
-        # Replace in tables
-        for table in doc.tables:
-            for row in table.rows:
-                for cell in row.cells:
-                    for paragraph in cell.paragraphs:
-                        for placeholder, value in replacements.items():
-                            if placeholder in paragraph.text:
-                                self.replace_placeholder_in_paragraph(paragraph, placeholder, value)
-        
-        # Replace in headers
-        for section in doc.sections:
-            header = section.header
-            for paragraph in header.paragraphs:
-                for placeholder, value in replacements.items():
-                    if placeholder in paragraph.text:
-                        self.replace_placeholder_in_paragraph(paragraph, placeholder, value)
-        
-        # Replace in footers
-        for section in doc.sections:
-            footer = section.footer
-            for paragraph in footer.paragraphs:
-                for placeholder, value in replacements.items():
-                    if placeholder in paragraph.text:
-                        self.replace_placeholder_in_paragraph(paragraph, placeholder, value)
-    
-    def replace_placeholder_in_paragraph(self, paragraph: Any, placeholder: str, replacement: str) -> None:
-        """Replace placeholder while preserving mixed formatting"""
-        if placeholder not in paragraph.text:
+        if not replacements:
             return
         
-        # Try simple replacement first (best case - placeholder is in one run)
-        for run in paragraph.runs:
-            if placeholder in run.text:
-                run.text = run.text.replace(placeholder, replacement)
-                return
-        
-        # Complex case: placeholder spans multiple runs
-        # We need to reconstruct the paragraph preserving different formatting for different parts
-        self.replace_across_runs(paragraph, placeholder, replacement)
-    
-    def replace_across_runs(self, paragraph: Any, placeholder: str, replacement: str) -> None:
-        """Replace placeholder that spans across multiple runs while preserving original formatting"""
-        
-        # Store all original runs with their formatting
-        original_runs = []
-        for run in paragraph.runs:
-            original_runs.append({
-                'text': run.text,
-                'bold': run.bold,
-                'italic': run.italic,
-                'underline': run.underline,
-                'font_name': run.font.name,
-                'font_size': run.font.size,
-                'font_color': run.font.color.rgb if run.font.color.rgb else None
-            })
-        
-        # Get the full text and find placeholder position
-        full_text = paragraph.text
-        placeholder_start = full_text.find(placeholder)
-        if placeholder_start == -1:
+        # Read the text of the body and of each header/footer once, then keep
+        # only the placeholders that actually occur in the document
+        body, *section_elements = self._part_elements(doc)
+        body_text = self._element_text(body)
+        section_parts = [(element, self._element_text(element)) for element in section_elements]
+        document_text = body_text + ''.join(text for _, text in section_parts)
+        active = {
+            placeholder: value for placeholder, value in replacements.items()
+            if placeholder in document_text
+        }
+        if not active:
             return
         
-        placeholder_end = placeholder_start + len(placeholder)
-        
-        # Split text into three parts: before placeholder, placeholder, after placeholder
-        before_text = full_text[:placeholder_start]
-        after_text = full_text[placeholder_end:]
-        
-        # Find the run that contains most of the placeholder for formatting reference
-        char_pos = 0
-        placeholder_run_format = None
+        # One alternation for the whole document: each text node is rewritten
+        # with a single sub()
+        pattern = _placeholder_pattern(frozenset(active))
         
-        for run_info in original_runs:
-            run_end = char_pos + len(run_info['text'])
-            if char_pos <= placeholder_start < run_end:
-                placeholder_run_format = run_info
-                break
-            char_pos = run_end
+        # Replace in body paragraphs, including those inside tables
+        if pattern.search(body_text):
+            self._replace_in_paragraphs(body, pattern, active)
         
-        # Fallback to first run if we can't find the placeholder run
-        if placeholder_run_format is None and original_runs:
-            placeholder_run_format = original_runs[0]
+        # Replace in headers and footers that contain placeholders
+        for element, text in section_parts:
+            if pattern.search(text):
+                self._replace_in_paragraphs(element, pattern, active)
+    
+    @staticmethod
+    def _part_elements(doc: Any) -> List[Any]:
+        """Return the body element followed by each section's header and footer element"""
+        elements = [doc.element.body]
+        for section in doc.sections:
+            elements.append(section.header._element)
+            elements.append(section.footer._element)
+        return elements
+    
+    @staticmethod
+    def _element_text(element: Any) -> str:
+        """Concatenate the w:t text beneath an XML element"""
+        return ''.join(node.text or '' for node in element.iter(qn('w:t')))
+    
+    @classmethod
+    def _replace_in_paragraphs(cls, element: Any, pattern: 're.Pattern[str]',
+                               replacements: Mapping[str, str]) -> None:
+        """Replace placeholders in every w:p beneath element, in one XML traversal"""
+        # Materialize first: replacing can restructure runs under the iterator
+        for paragraph in list(element.iter(qn('w:p'))):
+            cls._fast_replace(paragraph, pattern, replacements)
+    
+    @classmethod
+    def _fast_replace(cls, paragraph: Any, pattern: 're.Pattern[str]',
+                      replacements: Mapping[str, str]) -> bool:
+        """Replace placeholders by patching the paragraph's w:t text nodes in place
+        
+        Run properties are never touched, so formatting is preserved without
+        rebuilding runs. A placeholder split across several nodes is written
+        into the node where it starts and trimmed from the nodes it spans.
+        
+        Args:
+            paragraph: Paragraph (w:p) element to update
+            pattern: Alternation matching every key of replacements
+            replacements: Mapping of placeholder to replacement text
+            
+        Returns:
+            True if a replacement was made
+        """
+        text_nodes = list(paragraph.iter(qn('w:t')))
+        texts = [node.text or '' for node in text_nodes]
+        if not pattern.search(''.join(texts)):
+            return False
         
-        # Clear the paragraph
-        paragraph.clear()
+        def lookup(match: 're.Match[str]') -> str:
+            return replacements[match.group(0)]
         
-        # Method 1: Try to reconstruct the original structure intelligently
-        if before_text or after_text:
-            self.reconstruct_mixed_formatting(paragraph, before_text, replacement, after_text, original_runs, placeholder_run_format)
-        else:
-            # Simple case: just the placeholder
-            new_run = paragraph.add_run(replacement)
-            if placeholder_run_format:
-                self.apply_run_formatting(new_run, placeholder_run_format)
-    
-    def reconstruct_mixed_formatting(self, paragraph: Any, before_text: str, replacement: str, after_text: str, original_runs: List[Dict[str, Any]], placeholder_format: Optional[Dict[str, Any]]) -> None:
-        """Reconstruct paragraph with mixed formatting preserved"""
-        
-        # For now, use a simplified approach that preserves the most important formatting
-        # Add before text (try to preserve original formatting)
-        if before_text:
-            # Use the first run's formatting for the before text
-            before_run = paragraph.add_run(before_text)
-            if original_runs:
-                self.apply_run_formatting(before_run, original_runs[0])
-        
-        # Add replacement text with placeholder formatting  
-        replacement_run = paragraph.add_run(replacement)
-        if placeholder_format:
-            self.apply_run_formatting(replacement_run, placeholder_format)
-        
-        # Add after text (try to preserve original formatting)
-        if after_text:
-            # Use the last run's formatting for the after text
-            after_run = paragraph.add_run(after_text)
-            if original_runs:
-                self.apply_run_formatting(after_run, original_runs[-1])
-    
-    def apply_run_formatting(self, run: Any, format_info: Dict[str, Any]) -> None:
-        """Apply formatting from format_info dictionary to a run"""
-        if format_info.get('bold') is not None:
-            run.bold = format_info['bold']
-        if format_info.get('italic') is not None:
-            run.italic = format_info['italic']
-        if format_info.get('underline') is not None:
-            run.underline = format_info['underline']
-        if format_info.get('font_name'):
-            run.font.name = format_info['font_name']
-        if format_info.get('font_size'):
-            run.font.size = format_info['font_size']
-        if format_info.get('font_color'):
-            run.font.color.rgb = format_info['font_color']
-    
-    def replace_in_paragraph(self, paragraph: Any, placeholder: str, replacement: str) -> None:
-        """Replace placeholder in paragraph while preserving formatting"""
-        if placeholder not in paragraph.text:
-            return
+        # Common case: each placeholder sits inside a single text node
+        for index, text in enumerate(texts):
+            if text:
+                texts[index] = pattern.sub(lookup, text)
         
-        # Method 1: Try to replace within existing runs first (best formatting preservation)
-        for run in paragraph.runs:
-            if placeholder in run.text:
-                run.text = run.text.replace(placeholder, replacement)
-                return
+        # Placeholders spanning nodes (e.g. split by spell-check or formatting runs)
+        full_text = ''.join(texts)
+        match = pattern.search(full_text)
         
-        # Method 2: Handle placeholder spanning multiple runs with smart formatting detection
-        full_text = paragraph.text
-        if placeholder not in full_text:
-            return
+        while match:
+            start, end = match.span()
+            replacement = replacements[match.group(0)]
+            
+            # Locate the nodes the match overlaps
+            node_start = 0
+            overlapped = []
+            for index, text in enumerate(texts):
+                node_end = node_start + len(text)
+                if node_start < end and start < node_end:
+                    overlapped.append((index, node_start, node_end))
+                node_start = node_end
+            
+            if len(overlapped) == 1:
+                # Text within one node already went through sub() above
+                match = pattern.search(full_text, start + 1)
+                continue
+            
+            for position, (index, node_start, node_end) in enumerate(overlapped):
+                text = texts[index]
+                if position == 0:
+                    texts[index] = text[:start - node_start] + replacement
+                else:
+                    texts[index] = text[end - node_start:] if end < node_end else ''
+            
+            full_text = ''.join(texts)
+            match = pattern.search(full_text, start + len(replacement))
         
-        # Find placeholder position
-        placeholder_start = full_text.find(placeholder)
-        placeholder_end = placeholder_start + len(placeholder)
-        
-        # Collect all runs and their positions
-        runs_info = []
-        current_pos = 0
-        
-        for run in paragraph.runs:
-            run_start = current_pos
-            run_end = current_pos + len(run.text)
-            runs_info.append({
-                'run': run,
-                'start': run_start,
-                'end': run_end,
-                'text': run.text
-            })
-            current_pos = run_end
-        
-        # Find which runs contain the placeholder
-        affected_runs = []
-        for run_info in runs_info:
-            if (run_info['start'] < placeholder_end and run_info['end'] > placeholder_start):
-                affected_runs.append(run_info)
-        
-        if not affected_runs:
-            return
+        changed = []
+        for node, text in zip(text_nodes, texts):
+            if text == (node.text or ''):
+                continue
+            if text:
+                node.text = text
+                changed.append(node)
+            else:
+                # Drop the emptied node, and its run too if nothing but
+                # run properties would be left (strictly interior runs)
+                run = node.getparent()
+                run.remove(node)
+                if run.tag == qn('w:r') and all(child.tag == qn('w:rPr') for child in run):
+                    run.getparent().remove(run)
+        
+        cls._finish_text_nodes(changed)
+        return True
+    
+    @staticmethod
+    def _finish_text_nodes(nodes: List[Any]) -> None:
+        """Fix up w:t nodes whose text was assigned directly"""
+        for node in nodes:
+            text = node.text
+            run = node.getparent()
+            if run is None:
+                # Already re-rendered along with an earlier node of the same run
+                continue
+            if run.tag == qn('w:r') and ('\n' in text or '\r' in text or '\t' in text):
+                # Let the run re-render line breaks and tabs as w:br / w:tab
+                run.text = run.text
+            elif text != text.strip():
+                node.set(qn('xml:space'), 'preserve')
+    
+    def write_document(self, doc: Any, output_path: str,
+                       template: Optional['CompiledTemplate'] = None) -> int:
+        """Serialize a document in memory and write it to disk in a single call
+        
+        python-docx streams the .docx zip archive through many small writes and
+        seeks; rendering into a buffer first keeps that chatter off the
+        filesystem, which adds up when generating placards in bulk. A document
+        rendered from template is packaged by the template, which only zips
+        the parts that differ from it.
+        
+        Returns:
+            Number of bytes written
+        """
+        if template is not None:
+            data = template.package(doc)
+        else:
+            buffer = io.BytesIO()
+            doc.save(buffer)
+            data = buffer.getbuffer()
+        with open(output_path, 'wb') as output_file:
+            output_file.write(data)
+        return len(data)
+    
+    def load_template(self, template_path: Optional[str] = None) -> Optional[bytes]:
+        """Read the template file once and keep its bytes in memory
         
-        # Use the formatting from the run that contains the start of the placeholder
-        default_run = None
-        for run_info in affected_runs:
-            if run_info['start'] <= placeholder_start < run_info['end']:
-                default_run = run_info['run']
-                break
-        
-        if default_run is None:
-            default_run = affected_runs[0]['run']
-        
-        # Replace with mixed formatting preservation
-        self.replace_with_mixed_formatting(paragraph, placeholder, replacement, default_run)
-    
-    def apply_formatting(self, run: Any, bold: Optional[bool], italic: Optional[bool], underline: Optional[bool], font_name: Optional[str], font_size: Optional[Any], font_color: Optional[Any]) -> None:
-        """Apply formatting to a run"""
-        if bold is not None:
-            run.bold = bold
-        if italic is not None:
-            run.italic = italic
-        if underline is not None:
-            run.underline = underline
-        if font_name:
-            run.font.name = font_name
-        if font_size:
-            run.font.size = font_size
-        if font_color:
-            run.font.color.rgb = font_color
-    
-    def replace_with_mixed_formatting(self, paragraph: Any, placeholder: str, replacement: str, default_run: Any) -> None:
-        """Replace placeholder while preserving mixed formatting in the paragraph"""
-        # Get the full paragraph text
-        full_text = paragraph.text
-        
-        # Find placeholder position
-        placeholder_start = full_text.find(placeholder)
-        if placeholder_start == -1:
-            return
+        Later calls for the same path return the cached bytes after a single
+        stat; the file is only read again when its modification time changes,
+        so edits made during a long session are still picked up.
+        """
+        template_path = template_path or self.template_path
         
-        placeholder_end = placeholder_start + len(placeholder)
-        
-        # Split into before, placeholder, and after
-        before_text = full_text[:placeholder_start]
-        after_text = full_text[placeholder_end:]
-        
-        # Clear paragraph and rebuild with formatting
-        paragraph.clear()
-        
-        # Add before text (preserve original formatting from first run)
-        if before_text:
-            before_run = paragraph.add_run(before_text)
-            # Copy formatting from first original run
-            if paragraph.runs:  # This will be empty since we just cleared
-                pass  # We'll use default formatting
-        
-        # Add replacement text with default run formatting
-        replacement_run = paragraph.add_run(replacement)
-        self.apply_formatting(
-            replacement_run,
-            default_run.bold if default_run else None,
-            default_run.italic if default_run else None,
-            default_run.underline if default_run else None,
-            default_run.font.name if default_run else None,
-            default_run.font.size if default_run else None,
-            default_run.font.color.rgb if default_run and default_run.font.color.rgb else None
-        )
-    
-    def copy_template_content(self, template_path: str) -> Optional[Any]:
-        """Load template and return a copy"""
         try:
-            if not os.path.exists(template_path):
+            try:
+                template_mtime = os.stat(template_path).st_mtime
+            except FileNotFoundError:
                 self.print_with_timestamp(f"ERROR: Template file not found: {template_path}")
                 return None
             
-            doc = Document(template_path)  # type: ignore
-            return doc
+            if (self._template_bytes is not None and self._template_source == template_path
+                    and self._template_mtime == template_mtime):
+                return self._template_bytes
+            
+            with open(template_path, 'rb') as template_file:
+                self._template_bytes = template_file.read()
+            self._template_source = template_path
+            self._template_mtime = template_mtime
+            return self._template_bytes
         except Exception as e:
             self.print_with_timestamp(f"ERROR loading template: {e}")
             return None
     
-    def copy_formatted_content(self, source_doc: Any, target_doc: Any) -> None:
-        """Copy all content from source document to target document while preserving formatting"""
+    def copy_template_content(self, template_path: Optional[str] = None) -> Optional[Any]:
+        """Load template and return a copy"""
+        template_bytes = self.load_template(template_path)
+        if template_bytes is None:
+            return None
+        
         try:
-            # Copy paragraphs with full formatting
-            for paragraph in source_doc.paragraphs:
-                new_paragraph = target_doc.add_paragraph()
-                
-                # Copy paragraph-level formatting
-                new_paragraph.alignment = paragraph.alignment
-                new_paragraph.paragraph_format.space_before = paragraph.paragraph_format.space_before
-                new_paragraph.paragraph_format.space_after = paragraph.paragraph_format.space_after
-                new_paragraph.paragraph_format.line_spacing = paragraph.paragraph_format.line_spacing
+            return Document(io.BytesIO(template_bytes))  # type: ignore
+        except Exception as e:
+            self.print_with_timestamp(f"ERROR loading template: {e}")
+            return None
+    
+    @staticmethod
+    def _copy_run_properties(source_run: Any, target_run: Any) -> None:
+        """Give target_run a clone of source_run's run properties (w:rPr)
+        
+        One XML copy replaces reading and assigning bold, italic, underline,
+        font name, size and color one by one, each of which looks up or
+        creates rPr children; runs without properties are skipped entirely.
+        """
+        properties = source_run._r.rPr
+        if properties is not None:
+            target_run._r.insert(0, copy.deepcopy(properties))
+    
+    def copy_formatted_content(self, source_doc: Any, target_doc: Any) -> bool:
+        """Copy all content from source document to target document while preserving formatting
+        
+        Paragraphs and tables are cloned as XML, so every bit of formatting
+        comes along in one lxml copy per block element. The copy is all or
+        nothing: every element is built before any is attached, so a failure
+        leaves target_doc as it was instead of half-copied.
+        
+        Returns:
+            True if the content was copied
+        """
+        try:
+            if self.legacy_content_copy:
+                staging_doc = Document()
+                self._legacy_copy_formatted_content(source_doc, staging_doc)
+                source_body = staging_doc.element.body
+                blocks = [child for child in source_body.iterchildren() if child.tag != qn('w:sectPr')]
+            else:
+                blocks = [copy.deepcopy(child) for child in source_doc.element.body.iterchildren()
+                          if child.tag != qn('w:sectPr')]
+        except Exception as e:
+            self.print_with_timestamp(f"Warning: Error copying formatted content: {e}")
+            app_logger.error("Content copy error: %s", e, exc_info=True)
+            return False
+        
+        self._insert_body_elements(target_doc, blocks)
+        return True
+    
+    def _legacy_copy_formatted_content(self, source_doc: Any, target_doc: Any) -> None:
+        """Copy content paragraph by paragraph and run by run through python-docx"""
+        # Copy paragraphs with full formatting
+        for paragraph in source_doc.paragraphs:
+            new_paragraph = target_doc.add_paragraph()
+            
+            # Copy paragraph-level formatting
+            new_paragraph.alignment = paragraph.alignment
+            new_paragraph.paragraph_format.space_before = paragraph.paragraph_format.space_before
+            new_paragraph.paragraph_format.space_after = paragraph.paragraph_format.space_after
+            new_paragraph.paragraph_format.line_spacing = paragraph.paragraph_format.line_spacing
+            
+            # Copy all runs with their formatting
+            for run in paragraph.runs:
+                new_run = new_paragraph.add_run(run.text)
                 
-                # Copy all runs with their formatting
-                for run in paragraph.runs:
-                    new_run = new_paragraph.add_run(run.text)
+                # Copy run formatting
+                self._copy_run_properties(run, new_run)
+            
+        # Copy tables with formatting
+        for table in source_doc.tables:
+            new_table = target_doc.add_table(rows=len(table.rows), cols=len(table.columns))
+            
+            # Copy table style
+            if table.style:
+                new_table.style = table.style
+            
+            # Copy cell content and formatting
+            for i, row in enumerate(table.rows):
+                for j, cell in enumerate(row.cells):
+                    new_cell = new_table.cell(i, j)
                     
-                    # Copy run formatting
-                    new_run.bold = run.bold
-                    new_run.italic = run.italic
-                    new_run.underline = run.underline
-                    if run.font.name:
-                        new_run.font.name = run.font.name
-                    if run.font.size:
-                        new_run.font.size = run.font.size
-                    if run.font.color.rgb:
-                        new_run.font.color.rgb = run.font.color.rgb
-            
-            # Copy tables with formatting
-            for table in source_doc.tables:
-                new_table = target_doc.add_table(rows=len(table.rows), cols=len(table.columns))
-                
-                # Copy table style
-                if table.style:
-                    new_table.style = table.style
-                
-                # Copy cell content and formatting
-                for i, row in enumerate(table.rows):
-                    for j, cell in enumerate(row.cells):
-                        new_cell = new_table.cell(i, j)
+                    # Clear default paragraph and copy all paragraphs from source cell
+                    new_cell.paragraphs[0].clear()
+                    
+                    for paragraph in cell.paragraphs:
+                        if paragraph == cell.paragraphs[0]:
+                            # Use the existing first paragraph
+                            target_paragraph = new_cell.paragraphs[0]
+                        else:
+                            # Add new paragraph for additional ones
+                            target_paragraph = new_cell.add_paragraph()
                         
-                        # Clear default paragraph and copy all paragraphs from source cell
-                        new_cell.paragraphs[0].clear()
+                        # Copy paragraph formatting
+                        target_paragraph.alignment = paragraph.alignment
                         
-                        for paragraph in cell.paragraphs:
-                            if paragraph == cell.paragraphs[0]:
-                                # Use the existing first paragraph
-                                target_paragraph = new_cell.paragraphs[0]
-                            else:
-                                # Add new paragraph for additional ones
-                                target_paragraph = new_cell.add_paragraph()
-                            
-                            # Copy paragraph formatting
-                            target_paragraph.alignment = paragraph.alignment
-                            
-                            # Copy runs with formatting
-                            for run in paragraph.runs:
-                                new_run = target_paragraph.add_run(run.text)
-                                new_run.bold = run.bold
-                                new_run.italic = run.italic
-                                new_run.underline = run.underline
-                                if run.font.name:
-                                    new_run.font.name = run.font.name
-                                if run.font.size:
-                                    new_run.font.size = run.font.size
-                                if run.font.color.rgb:
-                                    new_run.font.color.rgb = run.font.color.rgb
-                                    
-        except Exception as e:
-            self.print_with_timestamp(f"Warning: Error copying formatted content: {e}")
-            # Fallback to simple text copy
-            for paragraph in source_doc.paragraphs:
-                target_doc.add_paragraph(paragraph.text)
-            for table in source_doc.tables:
-                new_table = target_doc.add_table(rows=len(table.rows), cols=len(table.columns))
-                for i, row in enumerate(table.rows):
-                    for j, cell in enumerate(row.cells):
-                        new_table.cell(i, j).text = cell.text
-    
-    def _process_shipment_data(self, matching_records: pd.DataFrame) -> Optional[Dict[str, List[str]]]:
-        """Process shipment data with validation and security checks"""
+                        # Copy runs with formatting
+                        for run in paragraph.runs:
+                            new_run = target_paragraph.add_run(run.text)
+                            self._copy_run_properties(run, new_run)
+    
+    def _process_shipment_data(self, matching_records: pd.DataFrame) -> Optional[List[PageData]]:
+        """Process shipment data with validation and security checks
+        
+        Invalid DO numbers and POs are dropped before the pages are built by
+        _build_page_data, the same builder placards use; each page field is
+        then validated with one vectorized pass, and invalid values are
+        replaced by safe defaults.
+        """
         try:
-            # Group by DO # for processing
-            do_groups = matching_records.groupby('DO #')
-            do_data = {
-                'do_numbers': [],
-                'pos': [],
-                'ship_to_info': [],
-                'start_ship_dates': [],
-                'vas_values': [],
-                'quantities': [],
-                'label_types': [],
-                'order_types': [],
-                'pmt_terms': []
-            }
-            
-            for do_num, group in do_groups:
-                # Validate DO number
-                if not self.validate_do_number(do_num):
-                    security_logger.warning(f"Invalid DO number in data: {do_num}")
-                    continue
-                    
-                do_data['do_numbers'].append(str(int(float(str(do_num)))))
-                
-                # Collect unique PO numbers for this DO with validation
-                po_list = group['PO'].dropna().unique().tolist()
-                validated_pos = []
-                for po in po_list:
-                    if InputValidator.validate_text_field(po, max_length=100):
-                        validated_pos.append(str(po).strip())
-                    else:
-                        security_logger.warning(f"Invalid PO number filtered: {po}")
-                
-                po_str = '\n'.join(validated_pos)
-                do_data['pos'].append(po_str)
-                
-                # Get and validate other info from first record of group
-                first_record = group.iloc[0]
-                
-                # Validate and sanitize text fields
-                ship_to = str(first_record['Ship To']) if pd.notna(first_record['Ship To']) else ''
-                if not InputValidator.validate_text_field(ship_to, max_length=500):
-                    security_logger.warning(f"Invalid ship_to field: {ship_to[:50]}...")
-                    ship_to = "INVALID_ADDRESS"
-                
-                label_type = str(first_record['Label Type']) if pd.notna(first_record['Label Type']) else ''
-                if not InputValidator.validate_text_field(label_type, max_length=100):
-                    security_logger.warning(f"Invalid label_type: {label_type}")
-                    label_type = "STANDARD"
-                
-                order_type = str(first_record['Order Type']) if pd.notna(first_record['Order Type']) else ''
-                if not InputValidator.validate_text_field(order_type, max_length=100):
-                    security_logger.warning(f"Invalid order_type: {order_type}")
-                    order_type = "STANDARD"
-                
-                pmt_term = str(first_record['Pmt Term']) if pd.notna(first_record['Pmt Term']) else ''
-                if not InputValidator.validate_text_field(pmt_term, max_length=100):
-                    security_logger.warning(f"Invalid pmt_term: {pmt_term}")
-                    pmt_term = "NET30"
-                
-                # Validate quantity
-                total_qty = group['Original Qty'].sum()
-                if not InputValidator.validate_numeric_field(total_qty, min_val=0, max_val=1e6):
-                    security_logger.warning(f"Invalid quantity: {total_qty}")
-                    total_qty = 0
-                
-                do_data['ship_to_info'].append(ship_to)
-                do_data['start_ship_dates'].append(self.format_date(first_record['Start Ship']))
-                do_data['vas_values'].append(self.get_vas_value(first_record['VAS']))
-                do_data['quantities'].append(f"{int(total_qty)} Units")
-                do_data['label_types'].append(label_type)
-                do_data['order_types'].append(order_type)
-                do_data['pmt_terms'].append(pmt_term)
-            
-            if not do_data['do_numbers']:
+            # Validate DO numbers
+            do_valid = InputValidator.validate_do_numbers(matching_records['DO #'])
+            for do_num in matching_records.loc[~do_valid, 'DO #'].dropna().unique():
+                security_logger.warning("Invalid DO number in data: %s", do_num)
+            records = matching_records[do_valid]
+            
+            if records.empty:
                 security_logger.error("No valid DO numbers found after validation")
                 return None
-                
-            return do_data
+            
+            # Validate PO numbers, dropping the invalid ones
+            pos = records['PO']
+            po_valid = InputValidator.validate_text_fields(pos, max_length=100)
+            for po in pos[~po_valid].unique():
+                security_logger.warning("Invalid PO number filtered: %s", po)
+            
+            pages = pd.DataFrame(self._build_page_data(records.assign(PO=pos.where(po_valid))))
+            
+            # Validate quantities
+            qty_valid = InputValidator.validate_numeric_fields(pages['quantity'], min_val=0, max_val=1e6)
+            for qty in pages.loc[~qty_valid, 'quantity']:
+                security_logger.warning("Invalid quantity: %s", qty)
+            pages['quantity'] = pages['quantity'].where(qty_valid, 0)
+            
+            # Validate and sanitize text fields
+            for column, max_length, fallback in (
+                ('ship_to', 500, "INVALID_ADDRESS"),
+                ('label_type', 100, "STANDARD"),
+                ('order_type', 100, "STANDARD"),
+                ('pmt_term', 100, "NET30"),
+            ):
+                values = pages[column]
+                valid = InputValidator.validate_text_fields(values, max_length=max_length)
+                for value in values[~valid]:
+                    security_logger.warning("Invalid %s field: %s", column, value[:50])
+                pages[column] = values.where(valid, fallback)
+            
+            return [PageData(*page) for page in pages.itertuples(index=False)]
             
         except Exception as e:
-            app_logger.error(f"Error processing shipment data: {e}", exc_info=True)
+            app_logger.error("Error processing shipment data: %s", e, exc_info=True)
             return None
     
-    def _create_secure_document(self, template_path: str, shipment_num: str, do_data: Dict[str, List[str]]) -> Optional[Any]:
+    def _create_secure_document(self, template_path: str, shipment_num: str, pages: List[PageData]) -> Optional[Any]:
         """Create document with security validation"""
         try:
             # Load template securely
@@ -855,29 +1284,22 @@ class PlacardGenerator:
                 return None
             
             # Process each DO as a separate page
-            for i, (do_num, po_str, ship_to, start_ship, vas, qty, label_type, order_type, pmt_term) in enumerate(
-                zip(do_data['do_numbers'], do_data['pos'], do_data['ship_to_info'], 
-                    do_data['start_ship_dates'], do_data['vas_values'], do_data['quantities'], 
-                    do_data['label_types'], do_data['order_types'], do_data['pmt_terms'])):
+            for i, page in enumerate(pages):
                 
                 # Add page break for subsequent pages
                 if i > 0:
                     doc.add_page_break()
-                    self.copy_formatted_content(doc, doc)
+                    if not self.copy_formatted_content(doc, doc):
+                        return None
                 
                 # Prepare replacements with additional validation
-                replacements = {
-                    '{{Ship To}}': ship_to[:500],  # Limit length
-                    '{{Shipment Nbr}}': shipment_num,
-                    '{{PO}}': po_str[:1000],  # Limit length
-                    '{{DO #}}': do_num,
-                    '{{VAS}}': vas,
-                    '{{Original Qty}}': qty,
-                    '{{Label Type}}': label_type[:100],  # Limit length
-                    '{{Order Type}}': order_type[:100],  # Limit length
-                    '{{Pmt Term}}': pmt_term[:100],  # Limit length
-                    '{{Start Ship}}': start_ship
-                }
+                replacements = page._replace(
+                    ship_to=page.ship_to[:500],  # Limit length
+                    po=page.po[:1000],  # Limit length
+                    label_type=page.label_type[:100],  # Limit length
+                    order_type=page.order_type[:100],  # Limit length
+                    pmt_term=page.pmt_term[:100]  # Limit length
+                ).replacements(shipment_num)
                 
                 # Replace placeholders
                 self.replace_placeholders_in_document(doc, replacements)
@@ -885,11 +1307,11 @@ class PlacardGenerator:
             return doc
             
         except Exception as e:
-            app_logger.error(f"Error creating document: {e}", exc_info=True)
+            app_logger.error("Error creating document: %s", e, exc_info=True)
             return None
     
     def _save_document_securely(self, doc: Any, shipment_num: str, do_count: int, 
-                               record_count: int, start_time: datetime) -> bool:
+                               record_count: int, start_time: float) -> bool:
         """Save document with security validation"""
         try:
             # Generate secure filename
@@ -900,23 +1322,23 @@ class PlacardGenerator:
             # Use secure path joining
             output_path = PathSanitizer.safe_join_path(self.output_folder, sanitized_filename)
             
-            # Ensure we can write to the output directory
-            if not os.access(self.output_folder, os.W_OK):
+            # Save document with error handling
+            try:
+                self.write_document(doc, output_path)
+            except PermissionError:
                 error_msg = f"No write permission to output directory: {self.output_folder}"
                 self.print_with_timestamp(f"ERROR: {error_msg}")
                 security_logger.error(error_msg)
                 return False
             
-            # Save document with error handling
-            doc.save(output_path)
-            
-            # Verify file was created and has reasonable size
-            if not os.path.exists(output_path):
+            # Verify file was created and has reasonable size, with one stat
+            try:
+                file_size = os.stat(output_path).st_size
+            except FileNotFoundError:
                 error_msg = "Document save failed - file not created"
                 self.print_with_timestamp(f"ERROR: {error_msg}")
                 return False
             
-            file_size = os.path.getsize(output_path)
             if file_size == 0:
                 error_msg = "Document save failed - empty file created"
                 self.print_with_timestamp(f"ERROR: {error_msg}")
@@ -929,7 +1351,7 @@ class PlacardGenerator:
             self.print_with_timestamp(f"✓ Successfully created: {sanitized_filename} ({file_size} bytes)")
             
             # Log successful processing
-            duration = (datetime.now() - start_time).total_seconds()
+            duration = time.perf_counter() - start_time
             self.log_event("SHIPMENT_PROCESS", 
                           shipment_number=shipment_num,
                           do_count=do_count,
@@ -940,7 +1362,7 @@ class PlacardGenerator:
                           duration=duration)
             
             if file_hash:
-                app_logger.info(f"Document created: {sanitized_filename} (SHA256: {file_hash[:16]}...)")
+                app_logger.info("Document created: %s (SHA256: %s...)", sanitized_filename, file_hash[:16])
             
             return True
             
@@ -953,14 +1375,11 @@ class PlacardGenerator:
         except Exception as e:
             error_msg = f"Failed to save document: {e}"
             self.print_with_timestamp(f"ERROR: {error_msg}")
-            app_logger.error(f"Document save error: {e}", exc_info=True)
+            app_logger.error("Document save error: %s", e, exc_info=True)
             return False
     
-    def process_shipment(self, shipment_num: str) -> bool:
-        """Process a single shipment number and generate placard"""
-        self.print_with_timestamp(f"\nProcessing shipment: {shipment_num}")
-        start_time = datetime.now()
-        
+    def _check_shipment_request(self, shipment_num: str) -> bool:
+        """Validate a requested shipment number and that data is loaded"""
         # Validate shipment number
         if not self.validate_shipment_number(shipment_num):
             error_msg = f"Invalid shipment number format: {shipment_num} (must be exactly 10 digits)"
@@ -977,152 +1396,336 @@ class PlacardGenerator:
                           status="FAILED", error_message=error_msg)
             return False
         
-        # Find shipment data - handle float values like 9010157586.0
-        # Convert both the column and search value to integers for comparison
-        df_shipment_clean = self.df['Shipment Nbr'].astype(float).astype(int).astype(str)
-        shipment_data = self.df[df_shipment_clean == shipment_num]
+        return True
+    
+    def process_shipment(self, shipment_num: str) -> bool:
+        """Process a single shipment number and generate placard"""
+        self.print_with_timestamp(f"\nProcessing shipment: {shipment_num}")
+        start_time = time.perf_counter()
+        
+        if not self._check_shipment_request(shipment_num):
+            return False
+        
+        shipment_data = self.get_shipment_data(shipment_num)
+        job = self._prepare_placard(shipment_num, shipment_data, start_time)
+        if job is None:
+            return False
+        
+        successful_count, _ = self._render_and_record([job])
+        return successful_count == 1
+    
+    def process_shipments_bulk(self, shipment_numbers: List[str]) -> Tuple[int, int]:
+        """Process several shipment numbers with a single pass over the dataset
+        
+        Each shipment's rows come straight from the shipment index built at
+        load time, and the documents themselves are rendered in parallel
+        worker processes. Successful shipments are logged at DEBUG level,
+        so by default only failures get their own log event; the batch as a
+        whole is logged once as BATCH_RESULT.
+        
+        Args:
+            shipment_numbers: Shipment numbers to generate placards for
+            
+        Returns:
+            Tuple of (successful_count, failed_count)
+        """
+        failed_ids: List[str] = []
+        jobs: List[_PlacardJob] = []
+        total_shipments = len(shipment_numbers)
+        batch_start = time.perf_counter()
+        
+        with self._interrupts_deferred():
+            for i, shipment_num in enumerate(shipment_numbers, 1):
+                if self._interrupted:
+                    break
+                self.print_with_timestamp(f"\n[{i}/{total_shipments}] Processing shipment: {shipment_num}")
+                start_time = time.perf_counter()
+                
+                if not self._check_shipment_request(shipment_num):
+                    failed_ids.append(shipment_num)
+                    continue
+                
+                shipment_data = self.get_shipment_data(shipment_num)
+                job = self._prepare_placard(shipment_num, shipment_data, start_time)
+                if job is None:
+                    failed_ids.append(shipment_num)
+                else:
+                    jobs.append(job)
+            
+            successful_count, render_failed_ids = self._render_and_record(jobs, success_level=logging.DEBUG)
+        
+        failed_ids.extend(render_failed_ids)
+        failed_count = len(failed_ids)
+        self.log_event("BATCH_RESULT", records_found=total_shipments,
+                      status=_COMPLETED_STATUS, args=(successful_count, failed_count),
+                      error_message=f"Failed: {','.join(failed_ids)}" if failed_ids else None,
+                      processing_mode="BULK", duration=time.perf_counter() - batch_start)
+        
+        if self._interrupted:
+            skipped = total_shipments - successful_count - failed_count
+            self.print_with_timestamp(f"Interrupted: {skipped} of {total_shipments} shipments were not processed.")
+        return successful_count, failed_count
+    
+    @staticmethod
+    def _build_page_data(records: pd.DataFrame) -> List[PageData]:
+        """Aggregate one shipment's records into a page per DO #, in DO # order
+        
+        Label Type, Order Type, Pmt Term, ship date and VAS are the same on
+        every page and come from the shipment's first record; Ship To comes
+        from each DO's first record, and POs are listed in first-seen order.
+        """
+        first_row = records.iloc[0]
+        shipment_fields = dict(
+            start_ship=first_row['_Start Ship Fmt'],
+            vas=first_row['_VAS'],
+            label_type=str(first_row['Label Type']),
+            order_type=str(first_row['Order Type']),
+            pmt_term=str(first_row['Pmt Term'])
+        )
+        
+        # Group by DO # in one pass over the rows: quantity totals and each
+        # DO's row positions come out together, so no per-DO DataFrame is built
+        quantities = pd.to_numeric(records['Original Qty'], errors='coerce').fillna(0)
+        do_numbers, do_quantities, do_positions = _group_rows(
+            records['DO #'], quantities.to_numpy(dtype=np.float64)
+        )
+        
+        ship_to_values = records['Ship To'].to_numpy()
+        po_values = records['PO'].to_numpy()
+        
+        pages = []
+        for do_num, total_original_qty, positions in zip(do_numbers, do_quantities, do_positions):
+            # Aggregate POs for this DO #, keeping first-seen order
+            unique_pos = dict.fromkeys(po for po in po_values[positions] if not pd.isna(po))
+            pages.append(PageData(
+                do_num=int(do_num),
+                ship_to=str(ship_to_values[positions[0]]),
+                po='\n'.join([str(po) for po in unique_pos if str(po).strip()]),
+                quantity=int(total_original_qty),
+                **shipment_fields
+            ))
+        return pages
+    
+    def _prepare_placard(self, shipment_num: str, shipment_data: pd.DataFrame,
+                         start_time: float) -> Optional[_PlacardJob]:
+        """Collect the per-page placeholder values for one shipment's records"""
         if shipment_data.empty:
             error_msg = f"No data found for shipment number: {shipment_num}"
             self.print_with_timestamp(f"ERROR: {error_msg}")
             self.log_event("SHIPMENT_PROCESS", shipment_number=shipment_num,
                           status="FAILED", error_message=error_msg)
-            return False
+            return None
         
         records_found = len(shipment_data)
         self.print_with_timestamp(f"Found {records_found} records for shipment {shipment_num}")
         
-        # Get template path
-        template_path = os.path.join(self.template_folder, "placard_template.docx")
+        page_data = self._build_page_data(shipment_data)
+        total_dos = len(page_data)
+        self.print_with_timestamp(f"Processing {total_dos} DO #s for shipment {shipment_num}")
         
-        # Create main document by copying template
-        main_doc = self.copy_template_content(template_path)
-        if not main_doc:
-            error_msg = "Failed to load template"
-            self.log_event("SHIPMENT_PROCESS", shipment_number=shipment_num,
-                          records_found=records_found, status="FAILED", error_message=error_msg)
-            return False
+        # Collect the replacements for each DO # page. _build_page_data gives
+        # every page the same shipment-level values, so those are built once.
+        base_replacements = page_data[0].shipment_replacements(shipment_num)
+        pages: List[Dict[str, str]] = []
+        for do_index, page in enumerate(page_data, 1):
+            if self.verbose:
+                self.print_with_timestamp(f"  Processing DO # {page.do_num} ({do_index}/{total_dos})")
+            pages.append({**base_replacements, **page.page_replacements()})
         
-        # Get shipment-level data (same for all pages)
-        first_row = shipment_data.iloc[0]
-        shipment_level_data = {
-            'Shipment Nbr': str(first_row['Shipment Nbr']),
-            'Label Type': str(first_row['Label Type']),
-            'Order Type': str(first_row['Order Type']),
-            'Pmt Term': str(first_row['Pmt Term']),
-            'Start Ship': self.format_date(first_row['Start Ship']),
-            'VAS': self.get_vas_value(first_row['VAS'])
-        }
+        output_filename = f"Placard_{shipment_num}.docx"
+        return _PlacardJob(
+            shipment_num=shipment_num,
+            records_found=records_found,
+            do_count=total_dos,
+            output_filename=output_filename,
+            output_path=os.path.join(self.output_folder, output_filename),
+            pages=pages,
+            start_time=start_time
+        )
+    
+    def compile_template(self, template_bytes: bytes) -> 'CompiledTemplate':
+        """Return the CompiledTemplate for template_bytes, reusing the last one built"""
+        compiled = self._compiled_template
+        if compiled is None or compiled.source_bytes != template_bytes:
+            compiled = CompiledTemplate(template_bytes)
+            self._compiled_template = compiled
+        return compiled
+    
+    def render_placard(self, template_bytes: bytes, pages: List[Dict[str, str]]) -> Optional[Any]:
+        """Build a multi-page placard document, one template copy per page"""
+        return self.compile_template(template_bytes).render_pages(pages)
+    
+    @classmethod
+    def _append_body(cls, source_doc: Any, target_doc: Any) -> None:
+        """Move the body content of source_doc to the end of target_doc
+        
+        The block elements (paragraphs and tables) are moved as XML, so they
+        keep every bit of formatting without walking runs and cells, and
+        without copying: source_doc is a throwaway page built from the same
+        template, so its style and relationship ids are valid in target_doc.
+        """
+        blocks = [child for child in source_doc.element.body.iterchildren()
+                  if child.tag != qn('w:sectPr')]
+        cls._insert_body_elements(target_doc, blocks)
+    
+    @staticmethod
+    def _insert_body_elements(target_doc: Any, blocks: List[Any]) -> None:
+        """Add block elements to the end of target_doc's body, ahead of its sectPr"""
+        target_body = target_doc.element.body
+        section_properties = target_body.sectPr
+        for child in blocks:
+            if section_properties is not None:
+                section_properties.addprevious(child)
+            else:
+                target_body.append(child)
+    
+    def render_placard_to_file(self, template_bytes: bytes, pages: List[Dict[str, str]],
+                               output_path: str) -> Optional[str]:
+        """Render a placard and save it to output_path
         
-        # Group by DO #
-        do_groups = shipment_data.groupby('DO #')
-        total_dos = len(do_groups)
+        Returns:
+            None on success, otherwise an error message
+        """
+        try:
+            compiled = self.compile_template(template_bytes)
+        except Exception as e:
+            return f"Failed to render document: {e}"
+        return compiled.write_placard(pages, output_path)
+    
+    def _render_placards(self, template_bytes: bytes,
+                         jobs: List[_PlacardJob]) -> Iterator[Tuple[_PlacardJob, Optional[str]]]:
+        """Render placards in worker processes, yielding (job, error) as each finishes
+        
+        Falls back to rendering in this process when there is only one job,
+        a single CPU, or the process pool cannot be used. Once an interrupt
+        has been requested, placards not yet started are skipped; those
+        already rendering are still finished and reported.
+        """
+        pending = dict(enumerate(jobs))
+        
+        if len(jobs) > 1 and _MAX_RENDER_WORKERS > 1:
+            try:
+                # The template goes to each worker once, not with every job
+                executor = ProcessPoolExecutor(max_workers=min(_MAX_RENDER_WORKERS, len(jobs)),
+                                               initializer=_init_render_worker,
+                                               initargs=(template_bytes,))
+                try:
+                    futures = {
+                        executor.submit(_render_placard, job.pages, job.output_path): i
+                        for i, job in pending.items()
+                    }
+                    cancelled = False
+                    for future in as_completed(futures):
+                        if future.cancelled():
+                            continue
+                        error_msg = future.result()
+                        yield pending.pop(futures[future]), error_msg
+                        if self._interrupted and not cancelled:
+                            cancelled = True
+                            for queued in futures:
+                                queued.cancel()
+                except BaseException:
+                    # A second Ctrl+C, a closed generator or a broken pool:
+                    # drop the queued placards instead of waiting for them
+                    executor.shutdown(wait=False, cancel_futures=True)
+                    raise
+                executor.shutdown()
+            except Exception as e:
+                app_logger.warning("Parallel rendering unavailable, continuing in-process: %s", e)
         
-        self.print_with_timestamp(f"Processing {total_dos} DO #s for shipment {shipment_num}")
+        for job in pending.values():
+            if self._interrupted:
+                return
+            yield job, self.render_placard_to_file(template_bytes, job.pages, job.output_path)
+    
+    def _render_and_record(self, jobs: List[_PlacardJob],
+                           success_level: int = logging.INFO) -> Tuple[int, List[str]]:
+        """Render prepared placards and report the outcome of each shipment
         
-        # Process each DO # and create pages
-        main_doc = None
+        Failures are logged as usual; successes are logged at success_level.
         
-        for do_index, (do_num, do_group) in enumerate(do_groups, 1):
-            self.print_with_timestamp(f"  Processing DO # {do_num} ({do_index}/{total_dos})")
-            
-            # Get page-level data
-            first_do_row = do_group.iloc[0]
-            
-            # Aggregate POs for this DO #
-            # Cast to Series to access .dropna method
-            po_series = cast(pd.Series, do_group['PO'])
-            unique_pos = po_series.dropna().unique()
-            po_list = '\n'.join([str(po) for po in unique_pos if str(po).strip()])
-            
-            # Calculate total Original Qty for this DO #
-            total_original_qty = do_group['Original Qty'].sum()
-            
-            page_level_data = {
-                'DO #': str(do_num),
-                'Ship To': str(first_do_row['Ship To']),
-                'PO': po_list,
-                'Original Qty': str(int(total_original_qty)) if not pd.isna(total_original_qty) else '0'
-            }
-            
-            # Combine all replacement data
-            replacements = {
-                '{{Ship To}}': page_level_data['Ship To'],
-                '{{Shipment Nbr}}': str(int(float(shipment_level_data['Shipment Nbr']))),  # Remove .0 from float
-                '{{PO}}': page_level_data['PO'],
-                '{{DO #}}': f"{int(page_level_data['DO #']):010d}",  # Format with leading zeros (10 digits)
-                '{{VAS}}': shipment_level_data['VAS'],
-                '{{Original Qty}}': page_level_data['Original Qty'] + ' Units',  # Add "Units" after quantity
-                '{{Label Type}}': shipment_level_data['Label Type'],
-                '{{Order Type}}': shipment_level_data['Order Type'],
-                '{{Pmt Term}}': shipment_level_data['Pmt Term'],
-                '{{Start Ship}}': shipment_level_data['Start Ship']
-            }
-            
-            # Create a fresh copy of template for this page
-            page_doc = Document(template_path)  # type: ignore
-            
-            # Replace placeholders in this page
-            self.replace_placeholders_in_document(page_doc, replacements)
-            
-            # Handle multi-page document creation
-            if do_index == 1:
-                # First page: use this as the main document
-                main_doc = page_doc
-            else:
-                # Subsequent pages: add page break and copy all content with formatting
-                if main_doc is not None:
-                    main_doc.add_page_break()
-                    self.copy_formatted_content(page_doc, main_doc)
+        Returns:
+            Tuple of (successful_count, failed shipment numbers)
+        """
+        if not jobs:
+            return 0, []
         
-        # Save document
-        output_filename = f"Placard_{shipment_num}.docx"
-        output_path = os.path.join(self.output_folder, output_filename)
+        template_bytes = self.load_template()
+        if template_bytes is None:
+            for job in jobs:
+                self._record_placard_result(job, "Failed to load template")
+            return 0, [job.shipment_num for job in jobs]
         
-        try:
-            if main_doc is not None:
-                main_doc.save(output_path)
-                duration = (datetime.now() - start_time).total_seconds()
-                self.print_with_timestamp(f"SUCCESS: Created placard document: {output_path}")
-                
-                # Log successful processing
-                self.log_event("SHIPMENT_PROCESS", shipment_number=shipment_num,
-                              do_count=total_dos, records_found=records_found,
-                              status="SUCCESS", output_file=output_filename, duration=duration)
-                return True
+        successful_count = 0
+        failed_ids: List[str] = []
+        total_jobs = len(jobs)
+        
+        for i, (job, error_msg) in enumerate(self._render_placards(template_bytes, jobs), 1):
+            if self._record_placard_result(job, error_msg, success_level):
+                successful_count += 1
             else:
-                error_msg = "No document was created"
-                self.print_with_timestamp(f"ERROR: {error_msg}")
-                duration = (datetime.now() - start_time).total_seconds()
-                self.log_event("SHIPMENT_PROCESS", shipment_number=shipment_num,
-                              do_count=total_dos, records_found=records_found,
-                              status="FAILED", error_message=error_msg, duration=duration)
-                return False
-        except Exception as e:
-            error_msg = f"ERROR saving document: {e}"
-            self.print_with_timestamp(error_msg)
-            duration = (datetime.now() - start_time).total_seconds()
-            self.log_event("SHIPMENT_PROCESS", shipment_number=shipment_num,
-                          do_count=total_dos, records_found=records_found,
-                          status="FAILED", error_message=str(e), duration=duration)
-            return False
+                failed_ids.append(job.shipment_num)
+            
+            # Show progress every 10 placards or at the end of a bulk run
+            if total_jobs > 1 and (i % 10 == 0 or i == total_jobs):
+                self.print_with_timestamp(f"Progress: {i}/{total_jobs} rendered ({successful_count} successful, {len(failed_ids)} failed)")
+        
+        return successful_count, failed_ids
+    
+    def _record_placard_result(self, job: _PlacardJob, error_msg: Optional[str],
+                               success_level: int = logging.INFO) -> bool:
+        """Report and log whether a shipment's placard was written"""
+        duration = time.perf_counter() - job.start_time
+        
+        if error_msg is None:
+            self.print_with_timestamp(f"SUCCESS: Created placard document: {job.output_path}")
+            
+            # Log successful processing
+            self.log_event("SHIPMENT_PROCESS", shipment_number=job.shipment_num,
+                          do_count=job.do_count, records_found=job.records_found,
+                          status="SUCCESS", output_file=job.output_filename, duration=duration,
+                          level=success_level)
+            return True
+        
+        self.print_with_timestamp(f"ERROR: {error_msg}")
+        self.log_event("SHIPMENT_PROCESS", shipment_number=job.shipment_num,
+                      do_count=job.do_count, records_found=job.records_found,
+                      status="FAILED", error_message=error_msg, duration=duration)
+        return False
+    
+    def _index_shipments(self, df: pd.DataFrame) -> None:
+        """Map each shipment number, as a digit string, to the positions of its rows
+        
+        The categorical column is grouped on its codes, so each distinct
+        shipment number is stringified once instead of once per row.
+        """
+        groups = df.groupby('Shipment Nbr', observed=True, sort=False).indices
+        self._shipment_index = dict(sorted(
+            (str(shipment_number), positions) for shipment_number, positions in groups.items()
+        ))
+    
+    def get_shipment_data(self, shipment_num: str) -> pd.DataFrame:
+        """Return the rows for one shipment number (empty if it has none)"""
+        df = cast(pd.DataFrame, self.df)
+        positions = self._shipment_index.get(shipment_num)
+        if positions is None:
+            return df.iloc[0:0]
+        return df.iloc[positions]
     
     def get_all_unique_shipments(self) -> List[str]:
         """Get all unique shipment numbers from the dataset"""
         if self.df is None:
             return []
         
-        # Get unique shipment numbers and convert to clean strings
-        df_shipment_clean = self.df['Shipment Nbr'].astype(float).astype(int).astype(str)
-        unique_shipments = df_shipment_clean.unique().tolist()
-        
-        # Filter valid shipment numbers
-        valid_shipments = [s for s in unique_shipments if self.validate_shipment_number(s)]
-        return sorted(valid_shipments)
+        # The shipment index keys are the unique shipment numbers, sorted;
+        # validate them all in one vectorized pass
+        shipments = pd.Series(list(self._shipment_index), dtype=object)
+        return shipments[InputValidator.validate_shipment_numbers(shipments)].tolist()
     
     def process_all_shipments(self) -> Tuple[int, int]:
         """Process all shipments in the dataset"""
         self.print_with_timestamp("\n=== Processing ALL Shipments ===")
-        start_time = datetime.now()
+        start_time = time.perf_counter()
         
         all_shipments = self.get_all_unique_shipments()
         if not all_shipments:
@@ -1138,34 +1741,20 @@ class PlacardGenerator:
                       processing_mode="BULK", status="STARTED")
         
         # Ask for confirmation
-        confirm = input(f"This will generate {len(all_shipments)} placard documents. Continue? (y/n): ").strip().lower()
-        if confirm not in ['y', 'yes']:
+        confirm = self._prompt(f"This will generate {len(all_shipments)} placard documents. Continue? (y/n): ").strip().lower()
+        if confirm not in _YES_ANSWERS:
             self.print_with_timestamp("Bulk processing cancelled.")
             self.log_event("BULK_PROCESS", status="CANCELLED", 
                           error_message="User cancelled bulk processing", processing_mode="BULK")
             return 0, 0
         
-        successful_count = 0
-        failed_count = 0
-        
-        # Process each shipment
-        for i, shipment_num in enumerate(all_shipments, 1):
-            self.print_with_timestamp(f"\n[{i}/{len(all_shipments)}] Processing shipment: {shipment_num}")
-            
-            if self.process_shipment(shipment_num):
-                successful_count += 1
-            else:
-                failed_count += 1
-                
-            # Show progress every 10 shipments or at the end
-            if i % 10 == 0 or i == len(all_shipments):
-                self.print_with_timestamp(f"Progress: {i}/{len(all_shipments)} processed ({successful_count} successful, {failed_count} failed)")
+        successful_count, failed_count = self.process_shipments_bulk(all_shipments)
         
         # Log bulk processing completion
-        duration = (datetime.now() - start_time).total_seconds()
+        duration = time.perf_counter() - start_time
         self.log_event("BULK_PROCESS_COMPLETE", 
                       records_found=len(all_shipments),
-                      status=f"COMPLETED: {successful_count} success, {failed_count} failed",
+                      status=_COMPLETED_STATUS, args=(successful_count, failed_count),
                       processing_mode="BULK", duration=duration,
                       error_message=f"Processed {len(all_shipments)} shipments")
         
@@ -1180,13 +1769,16 @@ class PlacardGenerator:
                 self.print_with_timestamp("2. Generate placards for ALL shipments in dataset")
                 self.print_with_timestamp("3. Exit")
                 
-                choice = input("Enter your choice (1-3): ").strip()
+                choice = self._prompt("Enter your choice (1-3): ").strip()
                 
                 if choice in ['1', '2', '3']:
                     return choice
                 else:
                     self.print_with_timestamp("Please enter 1, 2, or 3.")
                     
+            except EOFError:
+                # Piped input ran out: nothing more to do
+                return '3'
             except KeyboardInterrupt:
                 self.print_with_timestamp("\nOperation cancelled by user.")
                 sys.exit(0)
@@ -1198,7 +1790,7 @@ class PlacardGenerator:
         """Get shipment numbers from user input"""
         while True:
             try:
-                user_input = input("\nEnter one or more Shipment Numbers (comma-separated): ").strip()
+                user_input = self._prompt("\nEnter one or more Shipment Numbers (comma-separated): ").strip()
                 if not user_input:
                     self.print_with_timestamp("Please enter at least one shipment number.")
                     continue
@@ -1213,6 +1805,8 @@ class PlacardGenerator:
                 
                 return shipment_numbers
                 
+            except EOFError:
+                return []
             except KeyboardInterrupt:
                 self.print_with_timestamp("\nOperation cancelled by user.")
                 sys.exit(0)
@@ -1220,11 +1814,81 @@ class PlacardGenerator:
                 self.print_with_timestamp(f"Error reading input: {e}")
                 continue
     
+    def _run_manual_entry(self) -> _MenuResult:
+        """Menu option 1: generate placards for shipment numbers typed by the user"""
+        self.log_event("USER_CHOICE", processing_mode="MANUAL", status="SELECTED")
+        shipment_numbers = self.get_user_input()
+        
+        # Process each shipment
+        successful_count = 0
+        failed_count = 0
+        
+        with self._interrupts_deferred():
+            for shipment_num in shipment_numbers:
+                if self._interrupted:
+                    break
+                if self.process_shipment(shipment_num):
+                    successful_count += 1
+                else:
+                    failed_count += 1
+        
+        # Print and log the summary under one timestamp
+        now = datetime.now()
+        self.print_block_with_timestamp([
+            "\n=== Processing Summary ===",
+            f"Documents created: {successful_count}",
+            f"Failed inputs: {failed_count}"
+        ], ts=now)
+        
+        self.log_event("MANUAL_PROCESS_SUMMARY", 
+                      records_found=len(shipment_numbers),
+                      status=_COMPLETED_STATUS, args=(successful_count, failed_count),
+                      processing_mode="MANUAL", ts=now)
+        return _MenuResult(successful_count, failed_count)
+    
+    def _run_bulk(self) -> _MenuResult:
+        """Menu option 2: generate placards for every shipment in the dataset"""
+        self.log_event("USER_CHOICE", processing_mode="BULK", status="SELECTED")
+        successful_count, failed_count = self.process_all_shipments()
+        
+        # Print summary
+        self.print_block_with_timestamp([
+            "\n=== Bulk Processing Summary ===",
+            f"Documents created: {successful_count}",
+            f"Failed shipments: {failed_count}"
+        ])
+        return _MenuResult(successful_count, failed_count)
+    
+    def _run_exit(self) -> _MenuResult:
+        """Menu option 3: leave the main loop"""
+        self.print_with_timestamp("Exiting...")
+        return _MenuResult(0, 0, exit=True)
+    
+    def _menu_results(self) -> Iterator[_MenuResult]:
+        """Run main-menu actions until the session should end, yielding each outcome
+        
+        The session ends when the user exits or declines to return to the
+        menu, or when a batch was interrupted.
+        """
+        while True:
+            handler = self._menu.get(self.get_user_choice())
+            if handler is None:
+                continue
+            result = handler()
+            yield result
+            if result.exit or self._interrupted:
+                return
+            
+            # Ask if user wants to continue
+            continue_choice = self._prompt("\nReturn to main menu? (Y/n): ").strip().lower()
+            if continue_choice not in _CONTINUE_ANSWERS:
+                return
+    
     def run(self) -> None:
         """Main execution method"""
         self.print_with_timestamp("=== Shipping Placard Generator ===")
         self.print_with_timestamp("Loading data and preparing system...")
-        session_start = datetime.now()
+        session_start = time.perf_counter()
         
         # Setup directories
         if not self.setup_directories():
@@ -1240,16 +1904,14 @@ class PlacardGenerator:
         if not self.load_and_prepare_data():
             self.print_with_timestamp("Failed to load data. Please check the Data folder and file format.")
             self.log_event("SESSION_END", status="FAILED", 
-                          error_message="Failed to load data")
+                          error_message="Failed to load data", flush=True)
             return
         
-        # Check template exists
-        template_path = os.path.join(self.template_folder, "placard_template.docx")
-        if not os.path.exists(template_path):
-            error_msg = f"Template file not found: {template_path}"
-            self.print_with_timestamp(f"ERROR: {error_msg}")
+        # Load the template once up front; every placard is parsed from these bytes
+        if self.load_template() is None:
+            error_msg = f"Failed to load template: {self.template_path}"
             self.print_with_timestamp("Please place the template file 'placard_template.docx' in the Template folder.")
-            self.log_event("SESSION_END", status="FAILED", error_message=error_msg)
+            self.log_event("SESSION_END", status="FAILED", error_message=error_msg, flush=True)
             return
         
         self.print_with_timestamp("\nData loaded successfully! Ready to generate placards.")
@@ -1263,95 +1925,231 @@ class PlacardGenerator:
         total_successful = 0
         total_failed = 0
         
-        while True:
-            try:
-                # Get user choice
-                choice = self.get_user_choice()
-                
-                if choice == '1':
-                    # Manual shipment entry
-                    self.log_event("USER_CHOICE", processing_mode="MANUAL", status="SELECTED")
-                    shipment_numbers = self.get_user_input()
-                    
-                    # Process each shipment
-                    successful_count = 0
-                    failed_count = 0
-                    
-                    for shipment_num in shipment_numbers:
-                        if self.process_shipment(shipment_num):
-                            successful_count += 1
-                        else:
-                            failed_count += 1
-                    
-                    total_successful += successful_count
-                    total_failed += failed_count
-                    
-                    # Print summary
-                    self.print_with_timestamp(f"\n=== Processing Summary ===")
-                    self.print_with_timestamp(f"Documents created: {successful_count}")
-                    self.print_with_timestamp(f"Failed inputs: {failed_count}")
-                    
-                    # Log manual processing summary
-                    self.log_event("MANUAL_PROCESS_SUMMARY", 
-                                  records_found=len(shipment_numbers),
-                                  status=f"COMPLETED: {successful_count} success, {failed_count} failed",
-                                  processing_mode="MANUAL")
-                    
-                elif choice == '2':
-                    # Process all shipments
-                    self.log_event("USER_CHOICE", processing_mode="BULK", status="SELECTED")
-                    successful_count, failed_count = self.process_all_shipments()
-                    total_successful += successful_count
-                    total_failed += failed_count
-                    
-                    # Print summary
-                    self.print_with_timestamp(f"\n=== Bulk Processing Summary ===")
-                    self.print_with_timestamp(f"Documents created: {successful_count}")
-                    self.print_with_timestamp(f"Failed shipments: {failed_count}")
-                    
-                elif choice == '3':
-                    # Exit
-                    self.print_with_timestamp("Exiting...")
-                    break
-                
-                # Ask if user wants to continue (except after bulk processing or exit)
-                if choice != '2':
-                    continue_choice = input("\nReturn to main menu? (y/n): ").strip().lower()
-                    if continue_choice not in ['y', 'yes']:
-                        break
-                else:
-                    # After bulk processing, ask if they want to continue
-                    continue_choice = input("\nReturn to main menu? (y/n): ").strip().lower()
-                    if continue_choice not in ['y', 'yes']:
-                        break
-                    
-            except KeyboardInterrupt:
+        # Ctrl+C during a batch stops it at the next shipment boundary
+        self._interrupted = False
+        previous_sigint = None
+        if threading.current_thread() is threading.main_thread():
+            previous_sigint = signal.signal(signal.SIGINT, self._handle_sigint)
+        
+        try:
+            for result in self._menu_results():
+                total_successful += result.successful
+                total_failed += result.failed
+            
+            if self._interrupted:
                 self.print_with_timestamp("\n\nOperation cancelled by user.")
                 self.log_event("SESSION_END", status="INTERRUPTED", 
-                              error_message="User interrupted session")
-                break
-            except Exception as e:
-                self.print_with_timestamp(f"Unexpected error: {e}")
-                self.log_event("SESSION_END", status="ERROR", error_message=str(e))
-                break
+                              error_message="User interrupted session", flush=True)
+        except EOFError:
+            # Piped input ran out at a prompt
+            pass
+        except KeyboardInterrupt:
+            self.print_with_timestamp("\n\nOperation cancelled by user.")
+            self.log_event("SESSION_END", status="INTERRUPTED", 
+                          error_message="User interrupted session", flush=True)
+        except Exception as e:
+            self.print_with_timestamp(f"Unexpected error: {e}")
+            self.log_event("SESSION_END", status="ERROR", error_message=str(e), flush=True)
+        finally:
+            if previous_sigint is not None:
+                signal.signal(signal.SIGINT, previous_sigint)
         
         # Log session end
-        session_duration = (datetime.now() - session_start).total_seconds()
-        self.print_with_timestamp(f"\n=== Final Summary ===")
-        self.print_with_timestamp(f"Total documents created: {total_successful}")
-        self.print_with_timestamp(f"Total failed inputs: {total_failed}")
-        self.print_with_timestamp("Thank you for using the Shipping Placard Generator!")
-        
+        session_duration = time.perf_counter() - session_start
+        now = datetime.now()
+        self.print_block_with_timestamp([
+            "\n=== Final Summary ===",
+            f"Total documents created: {total_successful}",
+            f"Total failed inputs: {total_failed}",
+            "Thank you for using the Shipping Placard Generator!"
+        ], ts=now)
+        
+        # A quick session that produced nothing skips the fsync wait;
+        # close_log still writes the event out
+        worked = bool(total_successful or total_failed) or session_duration > _QUICK_SESSION_SECONDS
         self.log_event("SESSION_END", 
                       status="COMPLETED",
                       error_message=f"Total: {total_successful} success, {total_failed} failed",
-                      duration=session_duration)
+                      duration=session_duration, flush=worked, ts=now)
+
+
+class _SamePlaceholder(dict):
+    """Replacement mapping that maps every placeholder to itself"""
+    
+    def __missing__(self, key: str) -> str:
+        return key
+
+
+class CompiledTemplate:
+    """A placard template pre-scanned for the text nodes holding placeholders
+    
+    Every placard fills the same template, so the scan is done once: the
+    template is parsed, placeholders split across runs are merged into a
+    single w:t node, and the positions of the nodes containing placeholders
+    are recorded for each document part. Rendering a page then parses the
+    normalized template and patches only those nodes.
+    
+    The template's other parts (styles, theme, fonts, settings, media...)
+    never change, so they are zipped once into a static archive and each
+    rendered document only adds the parts it can change.
+    """
+    
+    # Placeholders look like {{Field Name}}
+    PLACEHOLDER_PATTERN = re.compile(r'\{\{[^{}]+\}\}')
+    
+    def __init__(self, template_bytes: bytes, placeholder_pattern: Optional['re.Pattern[str]'] = None):
+        self.source_bytes = template_bytes
+        self.pattern = placeholder_pattern or self.PLACEHOLDER_PATTERN
+        
+        doc = Document(io.BytesIO(template_bytes))  # type: ignore
+        elements = PlacardGenerator._part_elements(doc)
+        self.node_positions: List[List[int]] = []
+        for element in elements:
+            # Replacing each placeholder with itself stitches split ones together
+            PlacardGenerator._replace_in_paragraphs(element, self.pattern, _SamePlaceholder())
+            self.node_positions.append([
+                index for index, node in enumerate(element.iter(qn('w:t')))
+                if node.text and self.pattern.search(node.text)
+            ])
+        
+        # Zip members rendering can change: the body, which grows with every
+        # page, and any header or footer holding placeholders
+        part_names = {
+            id(part._element): str(part.partname).lstrip('/')
+            for part in doc.part.package.iter_parts() if hasattr(part, '_element')
+        }
+        self.dynamic_parts: List[str] = []
+        for part_index, (element, positions) in enumerate(zip(elements, self.node_positions)):
+            part_name = part_names[id(element.getroottree().getroot())]
+            if (part_index == 0 or positions) and part_name not in self.dynamic_parts:
+                self.dynamic_parts.append(part_name)
+        
+        buffer = io.BytesIO()
+        doc.save(buffer)
+        self.template_bytes = buffer.getvalue()
+        self.static_archive = self._build_static_archive(self.template_bytes, self.dynamic_parts)
+    
+    @staticmethod
+    def _build_static_archive(package_bytes: bytes, excluded: List[str]) -> bytes:
+        """Copy a .docx package without the excluded members, compressed once"""
+        buffer = io.BytesIO()
+        with zipfile.ZipFile(io.BytesIO(package_bytes)) as source, \
+                zipfile.ZipFile(buffer, 'w', zipfile.ZIP_DEFLATED) as target:
+            for info in source.infolist():
+                if info.filename not in excluded:
+                    target.writestr(info, source.read(info))
+        return buffer.getvalue()
+    
+    def package(self, doc: Any) -> bytes:
+        """Return the .docx bytes of a document rendered from this template
+        
+        Only the dynamic parts are serialized and compressed; they are
+        appended to a copy of the prebuilt static archive.
+        """
+        parts = {
+            str(part.partname).lstrip('/'): part
+            for part in doc.part.package.iter_parts()
+        }
+        buffer = io.BytesIO(self.static_archive)
+        with zipfile.ZipFile(buffer, 'a', zipfile.ZIP_DEFLATED) as archive:
+            for part_name in self.dynamic_parts:
+                archive.writestr(part_name, parts[part_name].blob)
+        return buffer.getvalue()
+    
+    def render_pages(self, pages: List[Dict[str, str]]) -> Optional[Any]:
+        """Build a multi-page document, one template copy per page"""
+        main_doc = None
+        
+        for replacements in pages:
+            # Create a fresh copy of template for this page with its
+            # placeholders filled in
+            page_doc = self.render(replacements)
+            
+            # Handle multi-page document creation
+            if main_doc is None:
+                # First page: use this as the main document
+                main_doc = page_doc
+            else:
+                # Subsequent pages: add page break and move the page's body over
+                main_doc.add_page_break()
+                PlacardGenerator._append_body(page_doc, main_doc)
+        
+        return main_doc
+    
+    def write_placard(self, pages: List[Dict[str, str]], output_path: str) -> Optional[str]:
+        """Render a placard and save it to output_path in a single write
+        
+        Returns:
+            None on success, otherwise an error message
+        """
+        try:
+            main_doc = self.render_pages(pages)
+        except Exception as e:
+            return f"Failed to render document: {e}"
+        
+        if main_doc is None:
+            return "No document was created"
+        
+        try:
+            with open(output_path, 'wb') as output_file:
+                output_file.write(self.package(main_doc))
+        except Exception as e:
+            return f"Failed to save document: {e}"
+        return None
+    
+    def render(self, replacements: Dict[str, str]) -> Any:
+        """Return a new document from the template with placeholders replaced
+        
+        Placeholders missing from replacements are left as they are.
+        """
+        def lookup(match: 're.Match[str]') -> str:
+            placeholder = match.group(0)
+            return replacements.get(placeholder, placeholder)
+        
+        doc = Document(io.BytesIO(self.template_bytes))  # type: ignore
+        for element, positions in zip(PlacardGenerator._part_elements(doc), self.node_positions):
+            if not positions:
+                continue
+            nodes = list(element.iter(qn('w:t')))
+            changed = []
+            for index in positions:
+                node = nodes[index]
+                text = self.pattern.sub(lookup, node.text)
+                if text != node.text:
+                    node.text = text
+                    changed.append(node)
+            PlacardGenerator._finish_text_nodes(changed)
+        return doc
+
+
+# Template used by _render_placard inside a worker process, set once by
+# _init_render_worker. Workers only hold the compiled template: they never
+# build a PlacardGenerator, so they set up no logging of their own.
+_worker_template: Optional[CompiledTemplate] = None
+
+
+def _init_render_worker(template_bytes: bytes) -> None:
+    """Render worker initializer: compile the template once
+    
+    Ctrl+C is ignored in workers; the parent process decides when to stop.
+    """
+    global _worker_template
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+    _worker_template = CompiledTemplate(template_bytes)
+
+
+def _render_placard(pages: List[Dict[str, str]], output_path: str) -> Optional[str]:
+    """Render one placard in a worker process; see CompiledTemplate.write_placard"""
+    return cast(CompiledTemplate, _worker_template).write_placard(pages, output_path)
 
 
 def main() -> None:
     """Main entry point"""
     generator = PlacardGenerator()
-    generator.run()
+    try:
+        generator.run()
+    finally:
+        generator.close_log()
 
 
 if __name__ == "__main__":
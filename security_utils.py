@@ -8,12 +8,20 @@ and secure file operations to prevent common vulnerabilities.
 
 import os
 import re
+import sys
+import time
 import hashlib
 import logging
 from pathlib import Path
-from typing import Optional, List, Any
+from typing import AbstractSet, Optional, List, Tuple, Any
 import pandas as pd
 
+try:
+    from .config import VALIDATION
+except ImportError:
+    # Standalone security_utils.py next to the standalone config.py
+    from config import VALIDATION
+
 # Configure security logger
 security_logger = logging.getLogger('security')
 security_logger.setLevel(logging.INFO)
@@ -25,8 +33,20 @@ class SecurityError(Exception):
 class InputValidator:
     """Comprehensive input validation utilities"""
     
-    @staticmethod
-    def validate_shipment_number(shipment_num: Any) -> bool:
+    # Identifier rules, compiled once and shared by the scalar and vectorized
+    # validators. The lookahead rejects values made of one repeated digit.
+    SHIPMENT_NUMBER_PATTERN = re.compile(
+        r'(?!(\d)\1*$)\d{%d,%d}' % (VALIDATION['SHIPMENT_NUMBER_MIN_LENGTH'],
+                                    VALIDATION['SHIPMENT_NUMBER_MAX_LENGTH'])
+    )
+    DO_NUMBER_PATTERN = re.compile(r'(?!(\d)\1*$)\d{6,15}')
+    SUSPICIOUS_CONTENT_PATTERN = re.compile(
+        r'<script[^>]*>.*?</script>|javascript:|vbscript:|on\w+\s*=|\\x[0-9a-fA-F]{2}',
+        re.IGNORECASE
+    )
+    
+    @classmethod
+    def validate_shipment_number(cls, shipment_num: Any) -> bool:
         """Validate shipment number with realistic criteria based on actual data"""
         if pd.isna(shipment_num) or shipment_num is None:
             return True  # Allow empty shipment numbers as they are optional
@@ -38,19 +58,12 @@ class InputValidator:
         if shipment_str.endswith('.0'):
             shipment_str = shipment_str[:-2]
         
-        # Must be 8-12 digits (allowing for various shipment number formats)
-        if not shipment_str.isdigit() or not (8 <= len(shipment_str) <= 12):
-            return False
-            
-        # Check for obviously invalid patterns
-        # Reject numbers with all same digits (e.g., 1111111111)
-        if len(set(shipment_str)) == 1:
-            return False
-            
-        return True
+        # Must be 8-12 digits, per VALIDATION (allowing for various shipment number formats),
+        # not all the same digit (e.g., 1111111111)
+        return cls.SHIPMENT_NUMBER_PATTERN.fullmatch(shipment_str) is not None
     
-    @staticmethod
-    def validate_do_number(do_num: Any) -> bool:
+    @classmethod
+    def validate_do_number(cls, do_num: Any) -> bool:
         """Validate DO number with enhanced security checks"""
         if pd.isna(do_num) or do_num is None:
             return False  # DO numbers are required
@@ -61,16 +74,9 @@ class InputValidator:
         if do_str.endswith('.0'):
             do_str = do_str[:-2]
         
-        # Must be at least 6 digits, max 15 (reasonable limit, based on actual data)
-        if not re.match(r'^\d{6,15}$', do_str):
-            return False
-            
-        # Additional validation: check for suspicious patterns
-        # Reject numbers with all same digits
-        if len(set(do_str)) == 1:
-            return False
-            
-        return True
+        # Must be at least 6 digits, max 15 (reasonable limit, based on actual
+        # data), and not all the same digit
+        return cls.DO_NUMBER_PATTERN.fullmatch(do_str) is not None
     
     @staticmethod
     def validate_text_field(text: Any, max_length: int = 1000, allow_empty: bool = True) -> bool:
@@ -98,7 +104,7 @@ class InputValidator:
         
         for pattern in suspicious_patterns:
             if re.search(pattern, text_str, re.IGNORECASE):
-                security_logger.warning(f"Suspicious content detected: {pattern}")
+                security_logger.warning("Suspicious content detected: %s", pattern)
                 return False
                 
         return True
@@ -115,6 +121,50 @@ class InputValidator:
         except (ValueError, TypeError):
             return False
 
+    @staticmethod
+    def _normalize_number_strings(values: pd.Series) -> pd.Series:
+        """Stringify and strip identifiers, dropping a trailing float '.0'"""
+        return values.astype(str).str.strip().str.replace(r'\.0$', '', regex=True)
+    
+    @classmethod
+    def validate_shipment_numbers(cls, values: pd.Series) -> pd.Series:
+        """Vectorized validate_shipment_number; returns a boolean mask of valid entries"""
+        normalized = cls._normalize_number_strings(values)
+        return values.isna() | normalized.str.fullmatch(cls.SHIPMENT_NUMBER_PATTERN)
+    
+    @classmethod
+    def validate_do_numbers(cls, values: pd.Series) -> pd.Series:
+        """Vectorized validate_do_number; returns a boolean mask of valid entries"""
+        normalized = cls._normalize_number_strings(values)
+        return values.notna() & normalized.str.fullmatch(cls.DO_NUMBER_PATTERN)
+    
+    @classmethod
+    def validate_text_fields(cls, values: pd.Series, max_length: int = 1000,
+                             allow_empty: bool = True) -> pd.Series:
+        """Vectorized validate_text_field; returns a boolean mask of valid entries"""
+        missing = values.isna()
+        # Columns read as pandas' string dtype need no conversion
+        if not isinstance(values.dtype, pd.StringDtype):
+            values = values.astype(str)
+        text = values.str.strip()
+        
+        suspicious = text.str.contains(cls.SUSPICIOUS_CONTENT_PATTERN)
+        if suspicious.any():
+            security_logger.warning("Suspicious content detected in %s values", int(suspicious.sum()))
+        
+        valid = (text.str.len() <= max_length) & ~suspicious
+        if not allow_empty:
+            valid &= text != ''
+        
+        return (missing & allow_empty) | (~missing & valid)
+    
+    @staticmethod
+    def validate_numeric_fields(values: pd.Series, min_val: float = 0,
+                                max_val: float = 1e9) -> pd.Series:
+        """Vectorized validate_numeric_field; returns a boolean mask of valid entries"""
+        numbers = pd.to_numeric(values, errors='coerce')
+        return numbers.between(min_val, max_val).fillna(False).astype(bool)
+
 class PathSanitizer:
     """Secure path operations to prevent directory traversal attacks"""
     
@@ -158,7 +208,7 @@ class PathSanitizer:
             return str(target_path).startswith(str(base_path))
             
         except (OSError, ValueError) as e:
-            security_logger.error(f"Path validation error: {e}")
+            security_logger.error("Path validation error: %s", e)
             return False
     
     @staticmethod
@@ -192,11 +242,11 @@ class SecureFileHandler:
         """Safely check if file exists with path validation"""
         try:
             if not PathSanitizer.validate_file_path(file_path, self.base_directory):
-                security_logger.warning(f"Path validation failed: {file_path}")
+                security_logger.warning("Path validation failed: %s", file_path)
                 return False
             return os.path.exists(file_path)
         except Exception as e:
-            security_logger.error(f"File existence check failed: {e}")
+            security_logger.error("File existence check failed: %s", e)
             return False
     
     def safe_list_files(self, pattern: str) -> List[str]:
@@ -215,12 +265,40 @@ class SecureFileHandler:
                 if PathSanitizer.validate_file_path(file_path, self.base_directory):
                     validated_files.append(file_path)
                 else:
-                    security_logger.warning(f"Filtered out invalid path: {file_path}")
+                    security_logger.warning("Filtered out invalid path: %s", file_path)
+            
+            return validated_files
+            
+        except Exception as e:
+            security_logger.error("File listing failed: %s", e)
+            return []
+    
+    def scan_prefix(self, prefix: str, extensions: Tuple[str, ...]) -> List[str]:
+        """List files whose name starts with prefix and ends with one of extensions
+        
+        A single directory scan replaces one glob per extension.
+        """
+        try:
+            with os.scandir(self.base_directory) as entries:
+                files = [
+                    entry.path for entry in entries
+                    if entry.name.startswith(prefix)
+                    and entry.name.lower().endswith(extensions)
+                    and entry.is_file()
+                ]
+            
+            # Additional validation for each file
+            validated_files = []
+            for file_path in files:
+                if PathSanitizer.validate_file_path(file_path, self.base_directory):
+                    validated_files.append(file_path)
+                else:
+                    security_logger.warning("Filtered out invalid path: %s", file_path)
             
             return validated_files
             
         except Exception as e:
-            security_logger.error(f"File listing failed: {e}")
+            security_logger.error("File listing failed: %s", e)
             return []
     
     def calculate_file_hash(self, file_path: str) -> Optional[str]:
@@ -229,14 +307,18 @@ class SecureFileHandler:
             if not self.safe_file_exists(file_path):
                 return None
                 
+            # Feed one reusable 1 MiB buffer instead of allocating a
+            # new bytes object per 4 KiB read
             hash_sha256 = hashlib.sha256()
-            with open(file_path, "rb") as f:
-                for chunk in iter(lambda: f.read(4096), b""):
-                    hash_sha256.update(chunk)
+            buffer = bytearray(1 << 20)
+            view = memoryview(buffer)
+            with open(file_path, "rb", buffering=0) as f:
+                for size in iter(lambda: f.readinto(buffer), 0):
+                    hash_sha256.update(view[:size])
             return hash_sha256.hexdigest()
             
         except Exception as e:
-            security_logger.error(f"File hash calculation failed: {e}")
+            security_logger.error("File hash calculation failed: %s", e)
             return None
 
 class SecurityConfig:
@@ -251,8 +333,8 @@ class SecurityConfig:
     MAX_PROCESSING_TIME = 3600  # 1 hour in seconds
     
     # Allowed file extensions
-    ALLOWED_EXCEL_EXTENSIONS = {'.xlsx', '.xls'}
-    ALLOWED_TEMPLATE_EXTENSIONS = {'.docx'}
+    ALLOWED_EXCEL_EXTENSIONS = frozenset(map(sys.intern, ('.xlsx', '.xls')))
+    ALLOWED_TEMPLATE_EXTENSIONS = frozenset(map(sys.intern, ('.docx',)))
     
     # Rate limiting
     MAX_OPERATIONS_PER_MINUTE = 60
@@ -267,9 +349,9 @@ class SecurityConfig:
             return False
     
     @staticmethod
-    def validate_file_extension(file_path: str, allowed_extensions: set) -> bool:
+    def validate_file_extension(file_path: str, allowed_extensions: AbstractSet[str]) -> bool:
         """Validate file extension against allowed list"""
-        file_ext = os.path.splitext(file_path)[1].lower()
+        file_ext = sys.intern(os.path.splitext(file_path)[1].lower())
         return file_ext in allowed_extensions
 
 # Rate limiting utility
@@ -283,8 +365,9 @@ class RateLimiter:
     
     def allow_operation(self) -> bool:
         """Check if operation is allowed based on rate limits"""
-        import time
-        current_time = time.time()
+        # Monotonic clock: the window must not stretch or shrink when the
+        # wall clock is adjusted
+        current_time = time.monotonic()
         
         # Remove old operations outside time window
         self.operations = [op_time for op_time in self.operations 
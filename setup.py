@@ -67,6 +67,10 @@ setup(
         "gui": [
             "dearpygui>=1.11.1",
         ],
+        "performance": [
+            "python-calamine>=0.2.0",
+            "pyarrow>=14.0.0",
+        ],
     },
     entry_points={
         "console_scripts": [